@@ -1,40 +1,45 @@
 import pandas as pd
+import pyarrow.parquet as pq
 
 def main():
-    # Read the CSV file
-    print("Loading CSV file...")
-    csv_path = '/Users/aakashbelide/Aakash/Higher Studies/Course/Sem-4/DAMG 7245/Case Study 3/pe-org-air-cs3/all_reviews.csv'
-    df = pd.read_csv(csv_path)
+    # Open the Parquet file (converted once by prepare_parquet.py). Column names, row count and
+    # dtypes come from the file metadata plus a 5-row batch; full columns are only read below
+    # for the company-related columns.
+    print("Opening Parquet file...")
+    parquet_path = '/Users/aakashbelide/Aakash/Higher Studies/Course/Sem-4/DAMG 7245/Case Study 3/pe-org-air-cs3/all_reviews.parquet'
+    parquet_file = pq.ParquetFile(parquet_path, memory_map=True)
+    columns = parquet_file.schema_arrow.names
+    df_head = next(parquet_file.iter_batches(batch_size=5)).to_pandas()
     
     # Print column names
     print('\n' + '=' * 70)
     print('COLUMN NAMES:')
     print('=' * 70)
-    for i, col in enumerate(df.columns, 1):
+    for i, col in enumerate(columns, 1):
         print(f'{i:2d}. {col}')
     
     print('\n' + '=' * 70)
-    print(f'Total rows: {len(df):,}')
-    print(f'Total columns: {len(df.columns)}')
+    print(f'Total rows: {parquet_file.metadata.num_rows:,}')
+    print(f'Total columns: {len(columns)}')
     print('=' * 70)
     
     # Display first few rows to understand the data structure
     print('\n' + '=' * 70)
     print('SAMPLE DATA (First 5 rows):')
     print('=' * 70)
-    print(df.head().to_string())
+    print(df_head.to_string())
     
     # Display data types
     print('\n' + '=' * 70)
     print('DATA TYPES:')
     print('=' * 70)
-    print(df.dtypes)
+    print(df_head.dtypes)
     
     # Check for company-related columns
     print('\n' + '=' * 70)
     print('CHECKING FOR COMPANY-RELATED COLUMNS:')
     print('=' * 70)
-    company_related_cols = [col for col in df.columns if 'company' in col.lower() 
+    company_related_cols = [col for col in columns if 'company' in col.lower() 
                            or 'firm' in col.lower() 
                            or 'employer' in col.lower()
                            or 'organization' in col.lower()
@@ -43,18 +48,26 @@ def main():
     
     if company_related_cols:
         print(f"Found {len(company_related_cols)} company-related columns:")
+        df = pd.read_parquet(parquet_path, columns=company_related_cols, memory_map=True)
         for col in company_related_cols:
             print(f"  - {col}")
-            # Show unique values if not too many
-            unique_count = df[col].nunique()
-            print(f"    Unique values: {unique_count}")
-            if unique_count <= 20:
-                print(f"    Values: {df[col].unique()[:20].tolist()}")
+            # Show unique values if not too many. A bounded prefix is enough to tell a
+            # high-cardinality column apart, so only low-cardinality columns get a full nunique().
+            head_unique = pd.unique(df[col].dropna().head(10_000))
+            if len(head_unique) > 20:
+                print(f"    Unique values: >= {len(head_unique):,} (first 10,000 rows)")
+                print(f"    Sample values: {head_unique[:10].tolist()}")
             else:
-                print(f"    Sample values: {df[col].dropna().unique()[:10].tolist()}")
+                unique_count = df[col].nunique()
+                print(f"    Unique values: {unique_count}")
+                if unique_count <= 20:
+                    print(f"    Values: {df[col].unique()[:20].tolist()}")
+                else:
+                    print(f"    Sample values: {df[col].dropna().unique()[:10].tolist()}")
     else:
         print("No obvious company-related columns found.")
         print("\nShowing sample values from all columns to help identify company data:")
+        df = next(parquet_file.iter_batches(batch_size=10_000)).to_pandas()
         for col in df.columns:
             print(f"\n{col}:")
             print(f"  Sample values: {df[col].dropna().head(3).tolist()}")
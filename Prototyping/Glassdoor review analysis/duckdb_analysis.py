@@ -1,29 +1,27 @@
-import duckdb
+from reviews_db import get_con
 
 def main():
-    csv_path = '/Users/aakashbelide/Aakash/Higher Studies/Course/Sem-4/DAMG 7245/Case Study 3/pe-org-air-cs3/all_reviews.csv'
-    
-    print("Connecting to CSV with DuckDB (this is much faster!)...")
+    print("Connecting to Parquet with DuckDB (this is much faster!)...")
     print("=" * 100)
     
-    # DuckDB can query CSV files directly without loading into memory
-    con = duckdb.connect(':memory:')
+    # DuckDB can query Parquet files directly without loading into memory
+    con = get_con()
     
     # First, let's peek at the structure
     print("\nSample data (first 10 rows):")
     print("=" * 100)
-    sample = con.execute(f"""
+    sample = con.execute("""
         SELECT firm_link, title, rating, date, job
-        FROM read_csv_auto('{csv_path}')
+        FROM reviews
         LIMIT 10
     """).fetchdf()
     print(sample.to_string())
     
     # Get total count
     print("\n" + "=" * 100)
-    total_count = con.execute(f"""
+    total_count = con.execute("""
         SELECT COUNT(*) as total
-        FROM read_csv_auto('{csv_path}')
+        FROM reviews
     """).fetchone()[0]
     print(f"Total reviews in dataset: {total_count:,}")
     
@@ -40,31 +38,45 @@ def main():
         'DG': ['dollar-general', 'dollargeneral']
     }
     
+    # One statement for all companies: DuckDB classifies each row with a CASE on the search
+    # conditions and groups by (ticker, firm_link) in a single multi-threaded scan
+    case_parts = []
     for ticker, search_terms in companies.items():
-        print(f"\n{ticker}:")
-        
         # Build SQL condition for all search terms
         conditions = " OR ".join([f"LOWER(firm_link) LIKE '%{term.lower()}%'" for term in search_terms])
-        
-        query = f"""
+        case_parts.append(f"WHEN {conditions} THEN '{ticker}'")
+    case_statement = "\n".join(case_parts)
+    
+    all_results = con.execute(f"""
+        SELECT 
+            ticker,
+            firm_link,
+            COUNT(*) as count
+        FROM (
             SELECT 
-                COUNT(*) as count,
-                firm_link
-            FROM read_csv_auto('{csv_path}')
-            WHERE {conditions}
-            GROUP BY firm_link
-            ORDER BY count DESC
-        """
-        
-        results = con.execute(query).fetchdf()
+                firm_link,
+                CASE 
+                    {case_statement}
+                    ELSE NULL
+                END as ticker
+            FROM reviews
+        )
+        WHERE ticker IS NOT NULL
+        GROUP BY ticker, firm_link
+        ORDER BY ticker, count DESC
+    """).fetchdf()
+    
+    for ticker in companies:
+        print(f"\n{ticker}:")
+        results = all_results[all_results['ticker'] == ticker]
         
         if len(results) > 0:
             total = results['count'].sum()
             print(f"  Total reviews: {total:,}")
             print(f"  Unique firm_links: {len(results)}")
             print(f"  Sample firm_links:")
-            for idx, row in results.head(5).iterrows():
-                print(f"    - {row['firm_link']} ({row['count']:,} reviews)")
+            for firm_link, count in results[['firm_link', 'count']].head(5).itertuples(index=False, name=None):
+                print(f"    - {firm_link} ({count:,} reviews)")
         else:
             print(f"  No reviews found")
     
@@ -73,18 +85,18 @@ def main():
     print("TOP 10 COMPANIES BY REVIEW COUNT:")
     print("=" * 100)
     
-    top_companies = con.execute(f"""
+    top_companies = con.execute("""
         SELECT firm_link, COUNT(*) as review_count
-        FROM read_csv_auto('{csv_path}')
+        FROM reviews
         GROUP BY firm_link
         ORDER BY review_count DESC
         LIMIT 10
     """).fetchdf()
     
-    for idx, row in top_companies.iterrows():
-        print(f"{idx+1:2d}. {row['firm_link']}: {row['review_count']:,} reviews")
+    top_rows = top_companies[['firm_link', 'review_count']].itertuples(index=False, name=None)
+    for i, (firm_link, review_count) in enumerate(top_rows, 1):
+        print(f"{i:2d}. {firm_link}: {review_count:,} reviews")
     
-    con.close()
     print("\n" + "=" * 100)
     print("Analysis complete!")
 
@@ -1,21 +1,30 @@
-import pandas as pd
+import random
+import re
+import pyarrow.compute as pc
+import pyarrow.dataset as ds
+from pyarrow import fs
 
 def main():
-    # Read the CSV file
-    print("Loading CSV file...")
-    csv_path = '/Users/aakashbelide/Aakash/Higher Studies/Course/Sem-4/DAMG 7245/Case Study 3/pe-org-air-cs3/all_reviews.csv'
-    df = pd.read_csv(csv_path, low_memory=False)
+    # Open the Parquet file (converted once by prepare_parquet.py) as a dataset, so each step
+    # below only reads what it needs instead of loading every row up front.
+    # The file is memory-mapped rather than read into a heap buffer first.
+    print("Opening Parquet dataset...")
+    parquet_path = '/Users/aakashbelide/Aakash/Higher Studies/Course/Sem-4/DAMG 7245/Case Study 3/pe-org-air-cs3/all_reviews.parquet'
+    dataset = ds.dataset(parquet_path, format='parquet', filesystem=fs.LocalFileSystem(use_mmap=True))
     
-    print(f"\nTotal rows: {len(df):,}")
-    print(f"Total columns: {len(df.columns)}")
+    # Row count comes from the Parquet footer, no data is decoded
+    total_rows = dataset.count_rows()
+    print(f"\nTotal rows: {total_rows:,}")
+    print(f"Total columns: {len(dataset.schema.names)}")
     
     # Let's look at more sample rows to understand the firm_link pattern
     print("\n" + "=" * 100)
     print("EXAMINING FIRM_LINK PATTERNS (20 random samples):")
     print("=" * 100)
     
-    sample_links = df['firm_link'].dropna().sample(min(20, len(df)), random_state=42)
-    for i, link in enumerate(sample_links, 1):
+    sample_indices = sorted(random.Random(42).sample(range(total_rows), min(20, total_rows)))
+    sample_links = dataset.take(sample_indices, columns=['firm_link']).column('firm_link').drop_null()
+    for i, link in enumerate(sample_links.to_pylist(), 1):
         print(f"{i:2d}. {link}")
     
     # Let's search for potential company names that might match our tickers
@@ -32,30 +41,44 @@ def main():
         'GE': ['general electric', 'ge-'],
         'DG': ['dollar general', 'dollargeneral', 'dg-']
     }
+    ticker_patterns = {
+        ticker: '|'.join(map(re.escape, search_terms))
+        for ticker, search_terms in companies_to_find.items()
+    }
+    
+    # Push one combined regex into the scan so only rows matching some company are materialized
+    any_company = pc.match_substring_regex(pc.field('firm_link'), '|'.join(ticker_patterns.values()), ignore_case=True)
+    hits = dataset.to_table(columns=['firm_link'], filter=any_company).column('firm_link')
     
-    for ticker, search_terms in companies_to_find.items():
+    # firm_link repeats heavily, so count reviews per distinct link once and run the
+    # per-ticker searches over the distinct links only
+    link_counts = pc.value_counts(hits)
+    unique_links = link_counts.field('values')
+    review_counts = link_counts.field('counts')
+    
+    for ticker, pattern in ticker_patterns.items():
         print(f"\n{ticker}:")
-        found = False
-        for term in search_terms:
-            # Search in firm_link (case insensitive)
-            matches = df[df['firm_link'].str.contains(term, case=False, na=False)]
-            if len(matches) > 0:
-                found = True
-                print(f"  Found {len(matches):,} reviews matching '{term}'")
-                # Show a few sample firm_links
-                sample_firm_links = matches['firm_link'].unique()[:3]
-                for link in sample_firm_links:
-                    print(f"    Sample: {link}")
-        
-        if not found:
-            print(f"  No matches found for any search terms: {search_terms}")
-    
-    # Let's also check what the most common firm_links are
+        # Search in firm_link (case insensitive), one Arrow regex pass per ticker
+        mask = pc.match_substring_regex(unique_links, pattern, ignore_case=True)
+        match_count = pc.sum(pc.filter(review_counts, mask)).as_py() or 0
+        if match_count > 0:
+            print(f"  Found {match_count:,} reviews matching any of {companies_to_find[ticker]}")
+            # Show a few sample firm_links
+            sample_firm_links = pc.filter(unique_links, mask).to_pylist()[:3]
+            for link in sample_firm_links:
+                print(f"    Sample: {link}")
+        else:
+            print(f"  No matches found for any search terms: {companies_to_find[ticker]}")
+    
+    # Let's also check what the most common firm_links are (the only step that needs every row)
     print("\n" + "=" * 100)
     print("TOP 20 COMPANIES BY REVIEW COUNT:")
     print("=" * 100)
-    top_companies = df['firm_link'].value_counts().head(20)
-    for i, (firm, count) in enumerate(top_companies.items(), 1):
+    all_link_counts = pc.value_counts(dataset.to_table(columns=['firm_link']).column('firm_link').drop_null())
+    top_indices = pc.array_sort_indices(all_link_counts.field('counts'), order='descending')[:20]
+    top_firms = pc.take(all_link_counts.field('values'), top_indices).to_pylist()
+    top_counts = pc.take(all_link_counts.field('counts'), top_indices).to_pylist()
+    for i, (firm, count) in enumerate(zip(top_firms, top_counts), 1):
         print(f"{i:2d}. {firm}: {count:,} reviews")
 
 if __name__ == "__main__":
@@ -1,13 +1,12 @@
-import duckdb
 import os
+from reviews_db import PARQUET_PATH, extract_query, get_con
 
 def main():
     base_path = '/Users/aakashbelide/Aakash/Higher Studies/Course/Sem-4/DAMG 7245/Case Study 3/pe-org-air-cs3'
-    source_csv = os.path.join(base_path, 'all_reviews.csv')
-    output_csv = os.path.join(base_path, 'Prototyping/Glassdoor review analysis/target_company_reviews_strict.csv')
+    output_dir = os.path.join(base_path, 'Prototyping/Glassdoor review analysis/target_company_reviews_strict')
     
-    print(f"Source: {source_csv}")
-    print(f"Output: {output_csv}")
+    print(f"Source: {PARQUET_PATH}")
+    print(f"Output: {output_dir}")
     
     # STRICT ID MAPPING based ONLY on user provided URLs
     # JPM: 145, NVDA: 7633, WMT: 715, GE: 277, DG: 1342
@@ -22,38 +21,9 @@ def main():
     print("Using Example IDs ONLY: 7633 (NVDA), 145 (JPM), 715 (WMT), 277 (GE), 1342 (DG)")
     print("-" * 50)
     
-    con = duckdb.connect(':memory:')
-    
-    # Constructing the exact same case logic but strictly for these IDs
-    case_parts = []
-    all_id_patterns = []
-    
-    for ticker, ids in ids_map.items():
-        # IDs are single items list here but good to keep structure generic
-        group_pattern = "|".join(ids)
-        # Add to the global search pattern
-        all_id_patterns.extend(ids)
-        # Add to the classifier
-        case_parts.append(f"WHEN regexp_matches(firm_link, '.*-E({group_pattern})[._].*') THEN '{ticker}'")
-    
-    # Join all IDs for the WHERE clause
-    full_id_regex = "|".join(all_id_patterns)
-    where_clause = f".*-E({full_id_regex})[._].*"
-    
-    case_statement = "\n".join(case_parts)
-    
-    query = f"""
-        COPY (
-            SELECT 
-                *,
-                CASE 
-                    {case_statement}
-                    ELSE 'UNKNOWN'
-                END as company_ticker
-            FROM read_csv_auto('{source_csv}')
-            WHERE regexp_matches(firm_link, '{where_clause}')
-        ) TO '{output_csv}' (HEADER, DELIMITER ',')
-    """
+    con = get_con()
+    # Constructing the exact same lookup logic but strictly for these IDs
+    query = extract_query(ids_map, output_dir)
     
     try:
         con.execute(query)
@@ -62,7 +32,7 @@ def main():
         # Verify result counts
         stats = con.execute(f"""
             SELECT company_ticker, COUNT(*) as count 
-            FROM read_csv_auto('{output_csv}') 
+            FROM read_parquet('{output_dir}/**/*.parquet', hive_partitioning = true) 
             GROUP BY company_ticker 
             ORDER BY count DESC
         """).fetchdf()
@@ -75,8 +45,6 @@ def main():
         
     except Exception as e:
         print(f"Error: {e}")
-    finally:
-        con.close()
 
 if __name__ == "__main__":
     main()
@@ -1,17 +1,18 @@
-import pandas as pd
-from collections import defaultdict
+import re
+import polars as pl
 
 def main():
-    csv_path = '/Users/aakashbelide/Aakash/Higher Studies/Course/Sem-4/DAMG 7245/Case Study 3/pe-org-air-cs3/all_reviews.csv'
+    parquet_path = '/Users/aakashbelide/Aakash/Higher Studies/Course/Sem-4/DAMG 7245/Case Study 3/pe-org-air-cs3/all_reviews.parquet'
     
     # First, let's just peek at the first 1000 rows to understand the data structure
     print("Reading first 1000 rows to understand data structure...")
-    sample_df = pd.read_csv(csv_path, nrows=1000)
+    reviews = pl.scan_parquet(parquet_path).select('firm_link')
+    sample_df = reviews.head(1000).collect()
     
     print("\n" + "=" * 100)
     print("SAMPLE FIRM_LINKS (first 50 unique):")
     print("=" * 100)
-    unique_links = sample_df['firm_link'].unique()[:50]
+    unique_links = sample_df['firm_link'].unique(maintain_order=True).head(50)
     for i, link in enumerate(unique_links, 1):
         print(f"{i:2d}. {link}")
     
@@ -29,28 +30,26 @@ def main():
         'DG': ['dollar-general', 'dollargeneral', 'dg-']
     }
     
-    # Count matches using chunking for efficiency
-    chunk_size = 500000  # Process 500k rows at a time
-    company_counts = defaultdict(int)
-    total_rows = 0
-    chunk_num = 0
+    # One case-insensitive alternation per ticker, so each row is tested once per company
+    # instead of once per search term
+    ticker_matches = {
+        ticker: pl.col('firm_link').str.contains('(?i)' + '|'.join(map(re.escape, search_terms)))
+        for ticker, search_terms in companies_to_find.items()
+    }
     
-    print("\nProcessing file in chunks...")
-    for chunk in pd.read_csv(csv_path, usecols=['firm_link'], chunksize=chunk_size, low_memory=False):
-        chunk_num += 1
-        total_rows += len(chunk)
-        print(f"  Processing chunk {chunk_num} ({total_rows:,} rows processed so far)...", end='\r')
-        
-        for ticker, search_terms in companies_to_find.items():
-            for term in search_terms:
-                matches = chunk[chunk['firm_link'].str.contains(term, case=False, na=False)]
-                if len(matches) > 0:
-                    company_counts[ticker] += len(matches)
-                    # Store sample links for the first match
-                    if f"{ticker}_samples" not in company_counts:
-                        company_counts[f"{ticker}_samples"] = matches['firm_link'].unique()[:5].tolist()
+    # firm_link repeats heavily, so Polars streams the file once to count reviews per distinct
+    # link, and the searches then run over the distinct links only
+    print("\nStreaming firm_link column...")
+    link_counts = reviews.group_by('firm_link', maintain_order=True).len().collect(engine='streaming')
+    total_rows = link_counts['len'].sum()
+    
+    company_counts = link_counts.select(
+        [pl.col('len').filter(match).sum().alias(ticker) for ticker, match in ticker_matches.items()]
+    ).row(0, named=True)
+    for ticker, match in ticker_matches.items():
+        company_counts[f"{ticker}_samples"] = link_counts.filter(match)['firm_link'].head(5).to_list()
     
-    print(f"\n\nTotal rows processed: {total_rows:,}")
+    print(f"\nTotal rows processed: {total_rows:,}")
     
     # Display results
     print("\n" + "=" * 100)
@@ -1,8 +1,6 @@
-import duckdb
+from reviews_db import get_con
 
 def main():
-    csv_path = '/Users/aakashbelide/Aakash/Higher Studies/Course/Sem-4/DAMG 7245/Case Study 3/pe-org-air-cs3/all_reviews.csv'
-    
     # Map of Company Name -> Glassdoor ID
     # Patterns to match: "-E{id}." (end of ID, start of extension) or "-E{id}_" (end of ID, start of pagination/filter)
     target_companies = {
@@ -16,10 +14,19 @@ def main():
     print("Analyzing Glassdoor reviews using Company IDs with DuckDB...")
     print("=" * 100)
     
-    con = duckdb.connect(':memory:')
+    con = get_con()
+    
+    # Load firm_link into memory once; every query below reads the cached table
+    # instead of re-scanning the Parquet-backed reviews view. The Glassdoor employer ID ("-E{id}" followed
+    # by "." or "_") is extracted once here so each lookup is a plain equality on eid.
+    con.execute("""
+        CREATE OR REPLACE TABLE review_links AS
+        SELECT firm_link, regexp_extract(firm_link, '-E([0-9]+)[._]', 1) AS eid
+        FROM reviews
+    """)
     
     # Get total count first
-    total_count = con.execute(f"SELECT COUNT(*) FROM read_csv_auto('{csv_path}')").fetchone()[0]
+    total_count = con.execute("SELECT COUNT(*) FROM review_links").fetchone()[0]
     print(f"Total reviews in dataset: {total_count:,}\n")
     
     print("=" * 100)
@@ -29,32 +36,30 @@ def main():
     for company, cid in target_companies.items():
         print(f"\nAnalyzing {company} (ID: E{cid})...")
         
-        # We look for the ID preceded by 'E' and followed by either '.' or '_'
+        # eid holds the digits between '-E' and the following '.' or '_'
         # This prevents E145 from matching E1450, E1459, etc.
-        query = f"""
-            SELECT 
-                firm_link,
-                COUNT(*) as count
-            FROM read_csv_auto('{csv_path}')
-            WHERE firm_link LIKE '%-E{cid}.%' 
-               OR firm_link LIKE '%-E{cid}_%'
-            GROUP BY firm_link
-            ORDER BY count DESC
-        """
-        
-        results = con.execute(query).fetchdf()
-        
-        total_company_reviews = results['count'].sum() if not results.empty else 0
+        total_company_reviews = con.execute(f"SELECT COUNT(*) FROM review_links WHERE eid = '{cid}'").fetchone()[0]
         print(f"  Total Reviews Found: {total_company_reviews:,}")
         
-        if not results.empty:
+        if total_company_reviews > 0:
+            # Only the printed URL patterns are grouped; LIMIT gives a top-K instead of a full sort
+            query = f"""
+                SELECT 
+                    firm_link,
+                    COUNT(*) as count
+                FROM review_links
+                WHERE eid = '{cid}'
+                GROUP BY firm_link
+                ORDER BY count DESC
+                LIMIT 5
+            """
+            results = con.execute(query).fetchdf()
             print("  Top 5 URL patterns found:")
-            for idx, row in results.head(5).iterrows():
-                print(f"    - {row['firm_link']} ({row['count']:,} reviews)")
+            for firm_link, count in results[['firm_link', 'count']].itertuples(index=False, name=None):
+                print(f"    - {firm_link} ({count:,} reviews)")
         else:
             print("  No reviews found with this ID.")
 
-    con.close()
     print("\n" + "=" * 100)
     print("Analysis complete!")
 
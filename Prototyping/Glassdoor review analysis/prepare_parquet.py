@@ -0,0 +1,33 @@
+import duckdb
+import os
+
+def main():
+    base_path = '/Users/aakashbelide/Aakash/Higher Studies/Course/Sem-4/DAMG 7245/Case Study 3/pe-org-air-cs3'
+    source_csv = os.path.join(base_path, 'all_reviews.csv')
+    output_parquet = os.path.join(base_path, 'all_reviews.parquet')
+    
+    print(f"Source: {source_csv}")
+    print(f"Output: {output_parquet}")
+    print("-" * 50)
+    
+    con = duckdb.connect(':memory:')
+    
+    # One-time conversion: every analysis script reads the Parquet copy instead of
+    # re-tokenizing the CSV, and gets column projection + row-group statistics for free.
+    query = f"""
+        COPY (
+            SELECT * FROM read_csv_auto('{source_csv}')
+        ) TO '{output_parquet}' (FORMAT PARQUET, COMPRESSION ZSTD, ROW_GROUP_SIZE 100000)
+    """
+    
+    try:
+        con.execute(query)
+        total_rows = con.execute(f"SELECT COUNT(*) FROM read_parquet('{output_parquet}')").fetchone()[0]
+        print(f"Parquet file written: {total_rows:,} rows")
+    except Exception as e:
+        print(f"Error during conversion: {e}")
+    finally:
+        con.close()
+
+if __name__ == "__main__":
+    main()
@@ -1,10 +1,8 @@
-import duckdb
+from reviews_db import get_con
 
 def main():
-    csv_path = '/Users/aakashbelide/Aakash/Higher Studies/Course/Sem-4/DAMG 7245/Case Study 3/pe-org-air-cs3/all_reviews.csv'
-    
-    # We will use REGEX to ensure we match the exact ID boundary
-    # Pattern: -E{id} followed by either a dot (.) or underscore (_) or end of string
+    # We extract the ID once with a REGEX to ensure we match the exact ID boundary
+    # Pattern: -E{id} followed by either a dot (.) or underscore (_)
     
     # Target 1: The IDs provided by the user
     requested_companies = {
@@ -26,7 +24,16 @@ def main():
     print("Refined Analysis with Strict ID Matching (DuckDB)...")
     print("=" * 100)
     
-    con = duckdb.connect(':memory:')
+    con = get_con()
+    
+    # Load firm_link into memory once; every query below reads the cached table
+    # instead of re-scanning the Parquet-backed reviews view. The Glassdoor employer ID ("-E{id}" followed
+    # by "." or "_") is extracted once here so each lookup is a plain equality on eid.
+    con.execute("""
+        CREATE OR REPLACE TABLE review_links AS
+        SELECT firm_link, regexp_extract(firm_link, '-E([0-9]+)[._]', 1) AS eid
+        FROM reviews
+    """)
     
     # 1. Analyze User-Provided IDs
     print(f"\n{' COMPANY (USER REQUESTED IDs) ':~^80}")
@@ -34,26 +41,26 @@ def main():
         cid = info['id']
         name = info['name']
         
-        # Strict Regex: URL must contain "-E" followed by the ID, followed by "." or "_"
-        # Note: We use string formatting to insert the ID into the regex pattern
-        query = f"""
-            SELECT 
-                firm_link,
-                COUNT(*) as count
-            FROM read_csv_auto('{csv_path}')
-            WHERE regexp_matches(firm_link, '.*-E{cid}[._].*')
-            GROUP BY firm_link
-            ORDER BY count DESC
-        """
-        
-        results = con.execute(query).fetchdf()
-        total = results['count'].sum() if not results.empty else 0
+        # Strict match: URL must contain "-E" followed by the ID, followed by "." or "_"
+        # (already extracted into eid when the table was loaded)
+        total = con.execute(f"SELECT COUNT(*) FROM review_links WHERE eid = '{cid}'").fetchone()[0]
         
         print(f"\n{name} (ID: {cid}) -> Total: {total:,}")
-        if not results.empty:
+        if total > 0:
+            query = f"""
+                SELECT 
+                    firm_link,
+                    COUNT(*) as count
+                FROM review_links
+                WHERE eid = '{cid}'
+                GROUP BY firm_link
+                ORDER BY count DESC
+                LIMIT 3
+            """
+            results = con.execute(query).fetchdf()
             print("  Top 3 matches:")
-            for idx, row in results.head(3).iterrows():
-                print(f"    - {row['firm_link']} ({row['count']:,})")
+            for firm_link, count in results[['firm_link', 'count']].itertuples(index=False, name=None):
+                print(f"    - {firm_link} ({count:,})")
 
     # 2. Analyze Discovered IDs (to help explain discrepancies)
     print(f"\n{' COMPANY (DATASET ALTERNATIVE IDs) ':~^80}")
@@ -61,26 +68,25 @@ def main():
         cid = info['id']
         name = info['name']
         
-        query = f"""
-            SELECT 
-                firm_link,
-                COUNT(*) as count
-            FROM read_csv_auto('{csv_path}')
-            WHERE regexp_matches(firm_link, '.*-E{cid}[._].*')
-            GROUP BY firm_link
-            ORDER BY count DESC
-        """
-        
-        results = con.execute(query).fetchdf()
-        total = results['count'].sum() if not results.empty else 0
+        total = con.execute(f"SELECT COUNT(*) FROM review_links WHERE eid = '{cid}'").fetchone()[0]
         
         print(f"\n{name} (ID: {cid}) -> Total: {total:,}")
-        if not results.empty:
+        if total > 0:
+            query = f"""
+                SELECT 
+                    firm_link,
+                    COUNT(*) as count
+                FROM review_links
+                WHERE eid = '{cid}'
+                GROUP BY firm_link
+                ORDER BY count DESC
+                LIMIT 3
+            """
+            results = con.execute(query).fetchdf()
             print("  Top 3 matches:")
-            for idx, row in results.head(3).iterrows():
-                print(f"    - {row['firm_link']} ({row['count']:,})")
+            for firm_link, count in results[['firm_link', 'count']].itertuples(index=False, name=None):
+                print(f"    - {firm_link} ({count:,})")
 
-    con.close()
     print("\n" + "=" * 100)
     print("Analysis complete!")
 
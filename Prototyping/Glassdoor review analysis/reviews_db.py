@@ -0,0 +1,35 @@
+import duckdb
+
+PARQUET_PATH = '/Users/aakashbelide/Aakash/Higher Studies/Course/Sem-4/DAMG 7245/Case Study 3/pe-org-air-cs3/all_reviews.parquet'
+
+# Single DuckDB connection shared by every analysis script imported into the same
+# process (notebook / REPL session), so connection setup and the Parquet view are paid once
+_con = None
+
+def get_con():
+    global _con
+    if _con is None:
+        _con = duckdb.connect(':memory:')
+        # Scripts query `reviews` instead of repeating the file path and reader call
+        _con.execute(f"CREATE OR REPLACE VIEW reviews AS SELECT * FROM read_parquet('{PARQUET_PATH}')")
+    return _con
+
+def extract_query(ids_map, output_dir):
+    """COPY statement writing the reviews of every {ticker: [company IDs]} entry to output_dir."""
+    # The ID (-E{id} followed by . or _) is extracted once per row and joined against an
+    # inline (id, ticker) table: a hash lookup per row, and rows whose ID is not a target drop out
+    id_values = ", ".join(
+        f"('{cid}', '{ticker}')" for ticker, ids in ids_map.items() for cid in ids
+    )
+    # Hive-partitioned Parquet dataset: one company_ticker=<TICKER>/ directory per company, so
+    # downstream readers filtering on a ticker only open that company's files
+    return f"""
+        COPY (
+            SELECT 
+                reviews.*,
+                target_ids.ticker as company_ticker
+            FROM reviews
+            JOIN (VALUES {id_values}) AS target_ids(id, ticker)
+              ON regexp_extract(reviews.firm_link, '-E([0-9]+)[._]', 1) = target_ids.id
+        ) TO '{output_dir}' (FORMAT PARQUET, PARTITION_BY (company_ticker), OVERWRITE_OR_IGNORE)
+    """
@@ -1,60 +1,160 @@
 import snowflake.connector
+import functools
 import os
+import pyarrow as pa
+import time
 from decimal import Decimal
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional, Tuple
 from dotenv import load_dotenv
 
+# SQL is kept as module constants so every call sends byte-identical text and
+# repeat tickers hit Snowflake's result cache (USE_CACHED_RESULT, set in _connect).
+COMPANY_SQL = "SELECT id, name, ticker, industry_id, position_factor, cik FROM companies WHERE ticker = %s"
+EVIDENCE_SQL = "SELECT category, source, normalized_score, confidence FROM external_signals WHERE company_id = %s"
+CULTURE_SQL = "SELECT * FROM culture_scores WHERE ticker = %s ORDER BY batch_date DESC LIMIT 1"
+JOBS_SQL = "SELECT title, description FROM signal_evidence WHERE company_id = %s AND category = 'technology_hiring'"
+GLASSDOOR_SQL = "SELECT title, pros, cons FROM glassdoor_reviews WHERE ticker = %s"
+
+# We join documents and document_chunks. We match by ticker or company name.
+SEC_CHUNKS_SQL = """
+    SELECT dc.section_name, dc.chunk_text 
+    FROM document_chunks dc
+    JOIN documents d ON dc.document_id = d.document_id
+    JOIN companies c ON (UPPER(d.cik) = UPPER(c.cik) OR UPPER(d.company_name) = UPPER(c.name) OR UPPER(d.company_name) = UPPER(c.ticker))
+    WHERE c.ticker = %s
+    LIMIT %s
+"""
+
+# Every statement resolves the ticker through the same CTE, so the whole bundle is one request.
+# SEC chunks are taken and joined in reading order by (document_id, chunk_index); chunk_id is
+# "<doc>_<n>" text, which would put "_10" before "_2".
+BUNDLE_SQL = """
+    WITH c AS (SELECT id, name, ticker, industry_id, position_factor, cik FROM companies WHERE ticker = %s)
+    SELECT * FROM c;
+
+    WITH c AS (SELECT id FROM companies WHERE ticker = %s)
+    SELECT es.category, es.source, es.normalized_score, es.confidence
+    FROM external_signals es JOIN c ON es.company_id = c.id;
+
+    WITH c AS (SELECT id FROM companies WHERE ticker = %s)
+    SELECT se.title, se.description
+    FROM signal_evidence se JOIN c ON se.company_id = c.id
+    WHERE se.category = 'technology_hiring';
+
+    WITH c AS (SELECT name, ticker, cik FROM companies WHERE ticker = %s)
+    SELECT COALESCE(LISTAGG(chunk_text, ' ') WITHIN GROUP (ORDER BY document_id, chunk_index), '') AS full_text,
+           COUNT(*) AS chunk_count,
+           ARRAY_AGG(DISTINCT section_name) AS sections
+    FROM (
+        SELECT dc.document_id, dc.chunk_index, dc.section_name, dc.chunk_text
+        FROM document_chunks dc
+        JOIN documents d ON dc.document_id = d.document_id
+        JOIN c ON (UPPER(d.cik) = UPPER(c.cik) OR UPPER(d.company_name) = UPPER(c.name) OR UPPER(d.company_name) = UPPER(c.ticker))
+        ORDER BY dc.document_id, dc.chunk_index
+        LIMIT %s
+    );
+
+    SELECT * FROM culture_scores WHERE ticker = %s ORDER BY batch_date DESC LIMIT 1;
+"""
+
+@functools.cache
+def load_env(env_path: str) -> None:
+    # Parse each .env file once per process; later clients reuse os.environ
+    load_dotenv(env_path)
+
 class SnowflakeClient:
+    # Company and culture rows change at most once per ingest, so reuse them for an hour
+    CACHE_TTL_SECONDS = 3600
+
     def __init__(self, env_path: str):
-        load_dotenv(env_path)
-        self.conn = snowflake.connector.connect(
+        load_env(env_path)
+        self.conn = self._connect()
+        self._company_cache: Dict[str, Tuple[Dict, float]] = {}
+        self._culture_cache: Dict[str, Tuple[Dict, float]] = {}
+
+    def _connect(self):
+        return snowflake.connector.connect(
             user=os.getenv("SNOWFLAKE_USER"),
             password=os.getenv("SNOWFLAKE_PASSWORD"),
             account=os.getenv("SNOWFLAKE_ACCOUNT"),
             warehouse=os.getenv("SNOWFLAKE_WAREHOUSE"),
             database=os.getenv("SNOWFLAKE_DATABASE"),
             schema=os.getenv("SNOWFLAKE_SCHEMA"),
-            role=os.getenv("SNOWFLAKE_ROLE")
+            role=os.getenv("SNOWFLAKE_ROLE"),
+            # NUMBER(p, s) columns come back from Arrow fetches as Decimal, like row fetches do
+            arrow_number_to_decimal=True,
+            session_parameters={"USE_CACHED_RESULT": True}
         )
 
+    def _cache_get(self, cache: Dict[str, Tuple[Dict, float]], key: str) -> Optional[Dict]:
+        entry = cache.get(key)
+        if entry and time.time() < entry[1]:
+            return entry[0]
+        return None
+
+    def _cache_put(self, cache: Dict[str, Tuple[Dict, float]], key: str, row: Optional[Dict]) -> Optional[Dict]:
+        # Misses are not cached so a newly ingested ticker shows up on the next call
+        if row:
+            cache[key] = (row, time.time() + self.CACHE_TTL_SECONDS)
+        return row
+
     def fetch_company(self, ticker: str) -> Dict:
+        cached = self._cache_get(self._company_cache, ticker)
+        if cached:
+            return cached
         cursor = self.conn.cursor(snowflake.connector.DictCursor)
-        cursor.execute("SELECT id, name, ticker, industry_id, position_factor, cik FROM companies WHERE ticker = %s", (ticker,))
-        return cursor.fetchone()
+        cursor.execute(COMPANY_SQL, (ticker,))
+        return self._cache_put(self._company_cache, ticker, cursor.fetchone())
 
-    def fetch_evidence(self, company_id: str) -> List[Dict]:
+    def fetch_evidence(self, company_id: str) -> pa.Table:
         cursor = self.conn.cursor(snowflake.connector.DictCursor)
-        cursor.execute("SELECT category, source, normalized_score, confidence FROM external_signals WHERE company_id = %s", (company_id,))
-        return cursor.fetchall()
+        cursor.execute(EVIDENCE_SQL, (company_id,))
+        return cursor.fetch_arrow_all(force_return_table=True)
 
     def fetch_culture_scores(self, ticker: str) -> Dict:
+        cached = self._cache_get(self._culture_cache, ticker)
+        if cached:
+            return cached
         cursor = self.conn.cursor(snowflake.connector.DictCursor)
-        cursor.execute("SELECT * FROM culture_scores WHERE ticker = %s ORDER BY batch_date DESC LIMIT 1", (ticker,))
-        return cursor.fetchone()
+        cursor.execute(CULTURE_SQL, (ticker,))
+        return self._cache_put(self._culture_cache, ticker, cursor.fetchone())
     
-    def fetch_job_descriptions(self, company_id: str) -> List[Dict]:
+    def fetch_job_descriptions(self, company_id: str) -> pa.Table:
         cursor = self.conn.cursor(snowflake.connector.DictCursor)
-        cursor.execute("SELECT title, description FROM signal_evidence WHERE company_id = %s AND category = 'technology_hiring'", (company_id,))
-        return cursor.fetchall()
+        cursor.execute(JOBS_SQL, (company_id,))
+        return cursor.fetch_arrow_all(force_return_table=True)
 
     def fetch_glassdoor_reviews(self, ticker: str) -> List[Dict]:
         cursor = self.conn.cursor(snowflake.connector.DictCursor)
-        cursor.execute("SELECT title, pros, cons FROM glassdoor_reviews WHERE ticker = %s", (ticker,))
+        cursor.execute(GLASSDOOR_SQL, (ticker,))
         return cursor.fetchall()
 
     def fetch_sec_chunks(self, ticker: str, limit: int = 10) -> List[Dict]:
         """Fetch SEC document chunks associated with the ticker/company."""
         cursor = self.conn.cursor(snowflake.connector.DictCursor)
-        # We join documents and document_chunks. We match by ticker or company name.
-        cursor.execute("""
-            SELECT dc.section_name, dc.chunk_text 
-            FROM document_chunks dc
-            JOIN documents d ON dc.document_id = d.document_id
-            JOIN companies c ON (UPPER(d.cik) = UPPER(c.cik) OR UPPER(d.company_name) = UPPER(c.name) OR UPPER(d.company_name) = UPPER(c.ticker))
-            WHERE c.ticker = %s
-            LIMIT %s
-        """, (ticker, limit))
+        cursor.execute(SEC_CHUNKS_SQL, (ticker, limit))
         return cursor.fetchall()
 
+    def fetch_bundle(self, ticker: str, sec_limit: int = 50):
+        """Fetch company, evidence, jobs, SEC text and culture in one multi-statement round-trip."""
+        cursor = self.conn.cursor(snowflake.connector.DictCursor)
+        cursor.execute(BUNDLE_SQL, (ticker, ticker, ticker, ticker, sec_limit, ticker), num_statements=5)
+
+        # Row-heavy result sets come back as Arrow tables so no per-row dicts are built;
+        # SEC chunks are already concatenated by LISTAGG into a single row
+        company = cursor.fetchone()
+        cursor.nextset()
+        evidence = cursor.fetch_arrow_all(force_return_table=True)
+        cursor.nextset()
+        jobs = cursor.fetch_arrow_all(force_return_table=True)
+        cursor.nextset()
+        sec_text = cursor.fetchone()
+        cursor.nextset()
+        culture = cursor.fetchone()
+        # Warm the TTL caches so follow-up per-method calls for this ticker stay local
+        self._cache_put(self._company_cache, ticker, company)
+        self._cache_put(self._culture_cache, ticker, culture)
+        return company, evidence, jobs, sec_text, culture
+
     def close(self):
         self.conn.close()
@@ -1,8 +1,14 @@
 
 import re
+from collections import defaultdict
 from dataclasses import dataclass, field
 from typing import List, Dict, Tuple, Optional
 
+# Honorifics stripped before matching ("Mr. Flynn" -> "Flynn")
+HONORIFIC_RE = re.compile(r'^(?:Mr|Ms|Mrs|Dr|Messrs)\.\s+', re.IGNORECASE)
+# Shortest first name accepted as a short form of another ("Greg" -> "Gregory")
+MIN_SHORT_FIRST_NAME = 3
+
 @dataclass
 class BoardMember:
     """A board member or executive."""
@@ -15,6 +21,14 @@ class BoardMember:
 
 def deduplicate_directors(api_directors: List[Dict]) -> List[BoardMember]:
     unique_members: Dict[str, BoardMember] = {}
+    # Candidates can only match on the same surname, so index keys by it and
+    # keep each key's name parts as a bitmask of interned token ids: the subset
+    # test becomes a single AND + compare instead of set hashing per comparison
+    by_surname: Dict[str, List[str]] = defaultdict(list)
+    key_masks: Dict[str, int] = {}
+    # First name + bitmask of the remaining parts, for short-form first names
+    key_first_names: Dict[str, Optional[Tuple[str, int]]] = {}
+    token_ids: Dict[str, int] = {}
     
     # Sort by name length descending to ensure full names act as master records
     sorted_directors = sorted(api_directors, key=lambda x: len(x.get('name', '')), reverse=True)
@@ -36,26 +50,39 @@ def deduplicate_directors(api_directors: List[Dict]) -> List[BoardMember]:
         
         # 1. Normalize name for mapping
         # Remove honorifics
-        clean_name = re.sub(r'^(Mr\.|Ms\.|Mrs\.|Dr\.|Messrs\.)\s+', '', name, flags=re.IGNORECASE)
+        clean_name = HONORIFIC_RE.sub('', name)
         
         # 2. Find existing match
+        # A match occurs if:
+        # - One name is a subset of the other (e.g., "Greg Penner" vs "Gregory B. Penner")
+        # - They share the same surname and one is just an honorific snippet (e.g., "Mr. Flynn" vs "Tim Flynn")
+        surname = clean_name.split()[-1].lower()
+        # Use space-separated parts for smarter matching
+        parts = clean_name.lower().replace('.', '').split()
+        part_bits = [1 << token_ids.setdefault(part, len(token_ids)) for part in parts]
+        name_mask = 0
+        for bit in part_bits:
+            name_mask |= bit
+        # e.g. ("greg", {penner}); single-part names like "Flynn" have no first name
+        first_name = (parts[0], name_mask & ~part_bits[0]) if len(parts) > 1 else None
         existing_key = None
-        for key in list(unique_members.keys()):
-            # A match occurs if:
-            # - One name is a subset of the other (e.g., "Greg Penner" vs "Gregory B. Penner")
-            # - They share the same surname and one is just an honorific snippet (e.g., "Mr. Flynn" vs "Tim Flynn")
-            
-            # Use space-separated parts for smarter matching
-            key_parts = set(key.lower().replace('.', '').split())
-            name_parts = set(clean_name.lower().replace('.', '').split())
-            
-            # Intersection check: if surnames match and one is a subset, it's a match
-            surname = clean_name.split()[-1].lower()
-            existing_surname = key.split()[-1].lower()
-            
-            if surname == existing_surname:
-                # If surnames match, check if one set of name parts is a subset of the other
-                if name_parts.issubset(key_parts) or key_parts.issubset(name_parts):
+        for key in by_surname[surname]:
+            # Surnames match, check if one set of name parts is a subset of the other
+            common = name_mask & key_masks[key]
+            if common == name_mask or common == key_masks[key]:
+                existing_key = key
+                break
+        if existing_key is None and first_name:
+            # Otherwise accept a short-form first name ("Greg Penner" vs "Gregory B. Penner")
+            # as long as the remaining parts are still a subset of each other
+            for key in by_surname[surname]:
+                key_first = key_first_names[key]
+                if not key_first:
+                    continue
+                short, full = sorted((first_name[0], key_first[0]), key=len)
+                rest = first_name[1] & key_first[1]
+                if (len(short) >= MIN_SHORT_FIRST_NAME and full.startswith(short)
+                        and (rest == first_name[1] or rest == key_first[1])):
                     existing_key = key
                     break
         
@@ -84,6 +111,10 @@ def deduplicate_directors(api_directors: List[Dict]) -> List[BoardMember]:
             if len(name) > len(existing.name):
                 unique_members.pop(existing_key)
                 unique_members[clean_name] = current_member
+                by_surname[surname].remove(existing_key)
+                by_surname[surname].append(clean_name)
+                key_masks[clean_name] = name_mask
+                key_first_names[clean_name] = first_name
             
             # Apply merged data to the entry in the map
             target = unique_members[clean_name if len(name) > len(existing.name) else existing_key]
@@ -93,6 +124,9 @@ def deduplicate_directors(api_directors: List[Dict]) -> List[BoardMember]:
             target.bio = best_bio
         else:
             unique_members[clean_name] = current_member
+            by_surname[surname].append(clean_name)
+            key_masks[clean_name] = name_mask
+            key_first_names[clean_name] = first_name
 
     return list(unique_members.values())
 
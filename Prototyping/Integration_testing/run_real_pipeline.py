@@ -1,5 +1,10 @@
 import sys
 import os
+import hashlib
+import inspect
+import shelve
+import threading
+import time
 from db_client import SnowflakeClient
 from scoring_engine import (
     ScoringIntegrationService, 
@@ -7,12 +12,74 @@ from scoring_engine import (
     SignalSource, 
     JobAnalysis, 
     BoardMember as SMBoardMember,
-    Dimension
+    Dimension,
+    DIMENSION_RUBRICS,
+    RubricScorer
 )
 # Import real board analyzer from platform
 sys.path.append(os.path.abspath("../../pe-org-air-platform"))
 from app.pipelines.board_analyzer import BoardCompositionAnalyzer
 from decimal import Decimal
+from concurrent.futures import ThreadPoolExecutor
+import ahocorasick
+import pyarrow.compute as pc
+
+def build_keyword_automaton(keywords):
+    """Aho-Corasick automaton that finds all keywords in one pass over a text."""
+    automaton = ahocorasick.Automaton()
+    for kw in keywords:
+        automaton.add_word(kw, kw)
+    automaton.make_automaton()
+    return automaton
+
+SENIOR_TITLE_KEYWORDS = ("principal", "staff", "director", "vp", "head")
+SENIOR_TITLE_AC = build_keyword_automaton(SENIOR_TITLE_KEYWORDS)
+SKILL_KEYWORDS = frozenset({"python", "ml", "aws", "snowflake", "pytorch", "spark"})
+SKILL_AC = build_keyword_automaton(SKILL_KEYWORDS)
+
+# On-disk cache so re-runs skip the SEC-API board call and rubric scoring
+CACHE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), ".pipeline_cache")
+CACHE_TTL_SECONDS = 86400
+_cache_lock = threading.Lock()  # the board fetch writes from a worker thread
+
+def cache_get(key: str):
+    with _cache_lock, shelve.open(CACHE_PATH) as cache:
+        entry = cache.get(key)
+    if entry and time.time() < entry[1]:
+        return entry[0]
+    return None
+
+def cache_put(key: str, value) -> None:
+    with _cache_lock, shelve.open(CACHE_PATH) as cache:
+        cache[key] = (value, time.time() + CACHE_TTL_SECONDS)
+
+def fetch_board_data_cached(board_analyzer: BoardCompositionAnalyzer, ticker: str):
+    key = f"board:{ticker}"
+    cached = cache_get(key)
+    if cached is not None:
+        return cached
+    members, committees = board_analyzer.fetch_board_data(ticker)
+    # Failed fetches come back empty; don't pin them for a day
+    if members or committees:
+        cache_put(key, (members, committees))
+    return members, committees
+
+# Rubric definitions and scoring logic are part of the cache key, so editing the keywords,
+# levels or _score_matches invalidates the cached SEC scores instead of serving them for a day
+RUBRIC_VERSION = hashlib.sha256(
+    (repr(DIMENSION_RUBRICS) + inspect.getsource(RubricScorer._score_matches)).encode("utf-8")
+).hexdigest()[:12]
+
+def score_sec_text_cached(rubric_scorer, sec_text: str, dimensions):
+    # Keyed by the text itself, so re-ingested SEC chunks invalidate the entry automatically
+    digest = hashlib.sha256(sec_text.encode("utf-8")).hexdigest()
+    key = f"rubric:{RUBRIC_VERSION}:{digest}:{','.join(d.value for d in dimensions)}"
+    cached = cache_get(key)
+    if cached is not None:
+        return cached
+    scores = rubric_scorer.score_text_batch(sec_text, dimensions)
+    cache_put(key, scores)
+    return scores
 
 def main(ticker: str):
     env_path = "../../pe-org-air-platform/.env"
@@ -26,83 +93,97 @@ def main(ticker: str):
 
     print(f"\n>>> Starting Advanced Integration Pipeline Simulation for {ticker}")
     
-    # 1. Fetch Company
-    company = db.fetch_company(ticker)
+    # The SEC-API board fetch is independent of Snowflake, so start it now and collect it in step 6.
+    # The bundle itself stays on this thread to reuse the client's main connection.
+    board_pool = ThreadPoolExecutor(max_workers=1)
+    board_future = board_pool.submit(fetch_board_data_cached, board_analyzer, ticker)
+
+    # 1. Fetch Company (all Snowflake queries for the ticker go out as one multi-statement request)
+    company, signals, jobs, sec_row, culture_data = db.fetch_bundle(ticker, sec_limit=50) # INCREASED LIMIT
     if not company:
         print(f"Error: Company {ticker} not found.")
+        board_pool.shutdown(wait=False, cancel_futures=True)
         db.close()
         return
     print(f"Fetched Company: {company['NAME']}")
 
     # 2. Fetch Evidence (External Signals)
-    signals = db.fetch_evidence(company['ID'])
-    print(f"Found {len(signals)} pre-calculated external signals.")
+    print(f"Found {signals.num_rows} pre-calculated external signals.")
     evidence_scores = []
-    for s in signals:
+    for category, normalized_score, confidence in zip(
+        signals.column('CATEGORY').to_pylist(),
+        signals.column('NORMALIZED_SCORE').to_pylist(),
+        signals.column('CONFIDENCE').to_pylist(),
+    ):
         try:
             # We skip Digital Presence if it's 0 to trigger our new Estimator
-            if s['CATEGORY'] == 'digital_presence' and float(s['NORMALIZED_SCORE'] or 0) == 0:
+            if category == 'digital_presence' and not normalized_score:
                 print("Skipping 0.0 Digital Presence to trigger Job-based Estimation...")
                 continue
             evidence_scores.append(EvidenceScore(
-                source=SignalSource(s['CATEGORY']),
-                raw_score=Decimal(str(s['NORMALIZED_SCORE'] or 0)),
-                confidence=Decimal(str(s['CONFIDENCE'] or 0.5)),
+                source=SignalSource(category),
+                raw_score=normalized_score or Decimal("0"),
+                confidence=confidence or Decimal("0.5"),
                 evidence_count=1
             ))
         except ValueError: continue
 
     # 3. Analyze Talent & Tech Footprint (Digital Presence Fix)
-    jobs = db.fetch_job_descriptions(company['ID'])
-    print(f"Analyzing {len(jobs)} Job Descriptions for Talent & Tech Markers...")
+    print(f"Analyzing {jobs.num_rows} Job Descriptions for Talent & Tech Markers...")
+    # NULLs are filled in Arrow so the pylists can be joined/scanned as-is;
+    # titles are only used for keyword matching, so lowercase them in one vectorized call
+    job_titles = pc.utf8_lower(jobs.column('TITLE').fill_null("")).to_pylist()
+    job_descriptions = jobs.column('DESCRIPTION').fill_null("").to_pylist()
     
-    combined_job_text = " ".join([(j['DESCRIPTION'] or "") for j in jobs])
-    senior_ai = sum(1 for j in jobs if any(kw in (j['TITLE'] or "").lower() for kw in ["principal", "staff", "director", "vp", "head"]))
+    combined_job_text = " ".join(job_descriptions)
+    # One pass over the jobs for both the seniority count and the skill set
+    senior_ai = 0
     unique_skills = set()
-    for j in jobs:
-        desc = (j['DESCRIPTION'] or "").lower()
-        for s in ["python", "ml", "aws", "snowflake", "pytorch", "spark"]:
-            if s in desc: unique_skills.add(s)
+    for title, desc in zip(job_titles, job_descriptions):
+        if next(SENIOR_TITLE_AC.iter(title), None) is not None:
+            senior_ai += 1
+        # Once every skill has been seen, later descriptions can't add anything
+        if len(unique_skills) < len(SKILL_KEYWORDS):
+            unique_skills.update(skill for _, skill in SKILL_AC.iter(desc.lower()))
 
     job_analysis = JobAnalysis(
-        total_ai_jobs=len(jobs),
+        total_ai_jobs=jobs.num_rows,
         senior_ai_jobs=senior_ai,
-        mid_ai_jobs=max(0, len(jobs) - senior_ai),
+        mid_ai_jobs=max(0, jobs.num_rows - senior_ai),
         entry_ai_jobs=0,
         unique_skills=unique_skills,
         raw_job_text=combined_job_text
     )
 
     # 4. SEC Item Scoring (Text-Based Rubrics)
-    sec_chunks = db.fetch_sec_chunks(ticker, limit=50) # INCREASED LIMIT
-    print(f"Found {len(sec_chunks)} SEC Document Chunks for Rubric Scoring.")
-    # Combine text for scoring
-    sec_text = " ".join([c['CHUNK_TEXT'] for c in sec_chunks])
+    print(f"Found {sec_row['CHUNK_COUNT']} SEC Document Chunks for Rubric Scoring.")
+    # Chunk text is concatenated server-side (LISTAGG) for scoring
+    sec_text = sec_row['FULL_TEXT']
     
+    sec_scores = score_sec_text_cached(service.rubric_scorer, sec_text, [Dimension.USE_CASE_PORTFOLIO, Dimension.AI_GOVERNANCE])
     # Item 1 -> Use Case Dimension
-    sec_1_score = service.rubric_scorer.score_text(sec_text, Dimension.USE_CASE_PORTFOLIO)
-    evidence_scores.append(EvidenceScore(SignalSource.SEC_ITEM_1, sec_1_score, Decimal("0.9"), 1))
+    evidence_scores.append(EvidenceScore(SignalSource.SEC_ITEM_1, sec_scores[Dimension.USE_CASE_PORTFOLIO], Decimal("0.9"), 1))
     
     # Item 1A -> Governance Dimension
-    sec_1a_score = service.rubric_scorer.score_text(sec_text, Dimension.AI_GOVERNANCE)
-    evidence_scores.append(EvidenceScore(SignalSource.SEC_ITEM_1A, sec_1a_score, Decimal("0.9"), 1))
+    evidence_scores.append(EvidenceScore(SignalSource.SEC_ITEM_1A, sec_scores[Dimension.AI_GOVERNANCE], Decimal("0.9"), 1))
 
     # 5. Culture & Glassdoor
-    culture_data = db.fetch_culture_scores(ticker)
     if culture_data:
-        avg_culture = (Decimal(str(culture_data['INNOVATION_SCORE'] or 0)) + Decimal(str(culture_data['AI_AWARENESS_SCORE'] or 0)) + Decimal(str(culture_data['CHANGE_READINESS_SCORE'] or 0))) / Decimal("3")
+        # NUMBER columns already arrive as Decimal from the connector
+        avg_culture = ((culture_data['INNOVATION_SCORE'] or 0) + (culture_data['AI_AWARENESS_SCORE'] or 0) + (culture_data['CHANGE_READINESS_SCORE'] or 0)) / Decimal("3")
         evidence_scores.append(EvidenceScore(SignalSource.GLASSDOOR_REVIEWS, avg_culture, Decimal("0.8"), culture_data['REVIEW_COUNT'] or 1))
 
     # 6. Real Board Data from SEC-API
     print("Fetching REAL Board Data from SEC-API.io...")
-    members, committees = board_analyzer.fetch_board_data(ticker)
+    members, committees = board_future.result()
+    board_pool.shutdown()
     
     # Run real analysis logic
     gov_signal = board_analyzer.analyze_board(company['ID'], ticker, members, committees)
     print(f"Board Analysis Score: {gov_signal.governance_score} (Confidence: {gov_signal.confidence})")
     
     # Add to evidence (Replacing the BOARD_COMPOSITION that service.score_company adds)
-    evidence_scores.append(EvidenceScore(SignalSource.BOARD_COMPOSITION, Decimal(str(gov_signal.governance_score)), Decimal(str(gov_signal.confidence)), 1))
+    evidence_scores.append(EvidenceScore(SignalSource.BOARD_COMPOSITION, gov_signal.governance_score, gov_signal.confidence, 1))
 
     # 7. Run Final Scoring
     results = service.score_company(
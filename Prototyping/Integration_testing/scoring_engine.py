@@ -1,11 +1,22 @@
 from decimal import Decimal, ROUND_HALF_UP
-from typing import Dict, List, Optional, Any, Set, Tuple
+from typing import Dict, List, Optional, Any, Sequence, Set, Tuple
+from collections import defaultdict
 from enum import Enum
 from dataclasses import dataclass, field
+from functools import cached_property, lru_cache
 import math
 import re
 import uuid
 import datetime
+import numpy as np
+import ahocorasick
+
+try:
+    from numba import njit
+except ImportError:
+    # Without numba the aggregation kernel still runs, just as interpreted NumPy
+    def njit(*args, **kwargs):
+        return lambda fn: fn
 
 # --- ENUMS & MODELS ---
 
@@ -29,6 +40,10 @@ class SignalSource(str, Enum):
     GLASSDOOR_REVIEWS = "glassdoor_reviews"
     BOARD_COMPOSITION = "board_composition"
 
+# Enum ordinals: row/column positions in SIGNAL_WEIGHT_MATRIX and the aggregation arrays
+SOURCE_INDEX = {src: i for i, src in enumerate(SignalSource)}
+DIMENSION_INDEX = {d: j for j, d in enumerate(Dimension)}
+
 class ScoreLevel(Enum):
     LEVEL_5 = (80, 100, "Excellent")
     LEVEL_4 = (60, 79, "Good")
@@ -51,6 +66,15 @@ class DimensionMapping:
     primary_weight: Decimal
     secondary_mappings: Dict[Dimension, Decimal] = field(default_factory=dict)
     reliability: Decimal = Decimal("0.8")
+    # Float copies used by the aggregation loop in score_company
+    primary_weight_f: float = field(init=False, repr=False)
+    reliability_f: float = field(init=False, repr=False)
+    secondary_mappings_f: Dict[Dimension, float] = field(init=False, repr=False)
+
+    def __post_init__(self):
+        self.primary_weight_f = float(self.primary_weight)
+        self.reliability_f = float(self.reliability)
+        self.secondary_mappings_f = {d: float(w) for d, w in self.secondary_mappings.items()}
 
 @dataclass
 class EvidenceScore:
@@ -59,6 +83,33 @@ class EvidenceScore:
     confidence: Decimal
     evidence_count: int
     metadata: Dict = field(default_factory=dict)
+    raw_score_f: float = field(init=False, repr=False)
+    confidence_f: float = field(init=False, repr=False)
+    source_idx: int = field(init=False, repr=False)
+
+    def __post_init__(self):
+        self.raw_score_f = float(self.raw_score)
+        self.confidence_f = float(self.confidence)
+        self.source_idx = SOURCE_INDEX[self.source]
+
+@dataclass
+class EvidenceBatch:
+    """Struct-of-arrays view of a company's evidence, one row per EvidenceScore."""
+    source_idx: np.ndarray
+    raw_score: np.ndarray
+    confidence: np.ndarray
+
+    @classmethod
+    def from_scores(cls, scores: List[EvidenceScore]) -> "EvidenceBatch":
+        n = len(scores)
+        return cls(
+            source_idx=np.fromiter((ev.source_idx for ev in scores), dtype=np.int64, count=n),
+            raw_score=np.fromiter((ev.raw_score_f for ev in scores), dtype=np.float64, count=n),
+            confidence=np.fromiter((ev.confidence_f for ev in scores), dtype=np.float64, count=n),
+        )
+
+    def __len__(self) -> int:
+        return len(self.source_idx)
 
 @dataclass
 class DimensionScore:
@@ -91,6 +142,11 @@ class JobAnalysis:
     unique_skills: Set[str]
     raw_job_text: str = ""
 
+    @cached_property
+    def raw_job_text_lower(self) -> str:
+        # Combined job text can be large; lowercase it once per analysis
+        return self.raw_job_text.lower()
+
 @dataclass
 class BoardMember:
     name: str
@@ -108,12 +164,36 @@ def to_decimal(value: float, places: int = 4) -> Decimal:
 def clamp(value: Decimal, min_val: Decimal = Decimal(0), max_val: Decimal = Decimal(100)) -> Decimal:
     return max(min_val, min(max_val, value))
 
-def weighted_mean(values: List[Decimal], weights: List[Decimal]) -> Decimal:
-    if len(values) != len(weights): raise ValueError("Mismatch")
-    if not values: return Decimal("0")
-    total_w = sum(weights)
-    if total_w == 0: return Decimal("0")
-    return sum(v * w for v, w in zip(values, weights)) / total_w
+@njit(cache=True)
+def _aggregate(src_idx: np.ndarray, raw: np.ndarray, conf: np.ndarray, W: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """Weighted per-dimension sums and total weights for one company's evidence."""
+    sums = np.zeros(W.shape[1])
+    wts = np.zeros(W.shape[1])
+    for i in range(len(src_idx)):
+        w = conf[i] * W[src_idx[i]]
+        sums += raw[i] * w
+        wts += w
+    return sums, wts
+
+def weighted_mean(values: Sequence[float], weights: Sequence[float]) -> float:
+    v = np.asarray(values, dtype=np.float64)
+    w = np.asarray(weights, dtype=np.float64)
+    if v.shape != w.shape: raise ValueError("Mismatch")
+    total_w = w.sum()
+    if total_w == 0: return 0.0
+    return float(np.dot(v, w) / total_w)
+
+def build_tagged_automaton(tagged_keywords: Dict[Any, List[str]]) -> ahocorasick.Automaton:
+    """Aho-Corasick automaton yielding every (tag, keyword) pair a match belongs to, in one pass over a text."""
+    payloads: Dict[str, List[Tuple[Any, str]]] = defaultdict(list)
+    for tag, keywords in tagged_keywords.items():
+        for kw in keywords:
+            payloads[kw].append((tag, kw))
+    automaton = ahocorasick.Automaton()
+    for kw, pairs in payloads.items():
+        automaton.add_word(kw, tuple(pairs))
+    automaton.make_automaton()
+    return automaton
 
 # --- RUBRICS ---
 
@@ -134,14 +214,46 @@ DIMENSION_RUBRICS = {
     }
 }
 
+# A single automaton over every dimension's keywords, tagged (dimension, level)
+RUBRIC_AUTOMATON = build_tagged_automaton({
+    (dim, level): crit.keywords
+    for dim, rubric in DIMENSION_RUBRICS.items()
+    for level, crit in rubric.items()
+})
+
+# Rubric scores are pure in (text, dimension), so repeat filings are scored once. The text
+# itself is the key: str caches its hash, and a hit on the same object compares by identity.
+# Kept small since every entry pins its (possibly 10-K sized) text in memory
+@lru_cache(maxsize=8)
+def _rubric_matches(text: str) -> Dict[Tuple[Dimension, ScoreLevel], frozenset]:
+    # One pass over the lowered text finds the matched keywords of every dimension and level
+    matches: Dict[Tuple[Dimension, ScoreLevel], Set[str]] = defaultdict(set)
+    for _, pairs in RUBRIC_AUTOMATON.iter(text.lower()):
+        for tag, kw in pairs:
+            matches[tag].add(kw)
+    return {tag: frozenset(kws) for tag, kws in matches.items()}
+
+@lru_cache(maxsize=128)
+def _cached_rubric_score(text: str, dimension: Dimension) -> Decimal:
+    return RubricScorer._score_matches(_rubric_matches(text), dimension)
+
 class RubricScorer:
     def score_text(self, text: str, dimension: Dimension) -> Decimal:
-        text = text.lower()
+        return _cached_rubric_score(text, dimension)
+
+    def score_text_batch(self, text: str, dimensions: List[Dimension]) -> Dict[Dimension, Decimal]:
+        # The text is lowercased and scanned once (via _rubric_matches) for every requested rubric
+        return {dim: _cached_rubric_score(text, dim) for dim in dimensions}
+
+    @staticmethod
+    def _score_matches(matches_by_tag: Dict[Tuple[Dimension, ScoreLevel], frozenset], dimension: Dimension) -> Decimal:
         rubric = DIMENSION_RUBRICS.get(dimension, {})
         for level in [ScoreLevel.LEVEL_5, ScoreLevel.LEVEL_4, ScoreLevel.LEVEL_3]:
             crit = rubric.get(level)
             if not crit: continue
-            matches = [kw for kw in crit.keywords if kw in text]
+            # Matches arrive already counted from the single automaton pass; the density below
+            # needs the full count, so stopping at min_keyword_matches would change the score
+            matches = matches_by_tag.get((dimension, level), frozenset())
             if len(matches) >= crit.min_keyword_matches:
                 density = len(matches) / len(crit.keywords)
                 score = level.min_score + (density * (level.max_score - level.min_score))
@@ -157,39 +269,51 @@ class DigitalPresenceAnalyzer:
         "data_platform": ["snowflake", "databricks", "spark", "hadoop", "bigquery", "redshift"],
         "ai_api": ["openai", "anthropic", "huggingface", "cohere", "langchain"]
     }
+    # Payloads are (category, tech); "databricks" sits in two categories and counts for both
+    TECH_AC = build_tagged_automaton(TECH_INDICATORS)
 
-    def analyze(self, job_text: str) -> Decimal:
-        text = job_text.lower()
-        detections = []
-        categories_found = set()
-        for cat, techs in self.TECH_INDICATORS.items():
-            for tech in techs:
-                if tech in text:
-                    detections.append(tech)
-                    categories_found.add(cat)
+    def analyze(self, job_text: str, text_lower: Optional[str] = None) -> Decimal:
+        text = text_lower if text_lower is not None else job_text.lower()
+        detections = {pair for _, pairs in self.TECH_AC.iter(text) for pair in pairs}
+        categories_found = {cat for cat, _ in detections}
         final_score = min(len(detections) * 10, 50) + min(len(categories_found) * 12.5, 50)
         return Decimal(str(round(final_score, 2)))
 
 class BoardAnalyzer:
     TECH_PATTERNS = [r'\bai\b', r'\bartificial\s+intelligence\b', r'\bmachine\s+learning\b', r'\bchief\s+technology\b', r'\bcto\b', r'\bdigital\b']
     TECH_COMMITTEE_PATTERNS = [r'\btechnology\s+committee\b', r'\binnovation\s+committee\b', r'\bdigital\s+strategy\b']
+    # Each list compiled once into a single alternation: one scan per text instead of one per pattern
+    TECH_RE = re.compile('|'.join(TECH_PATTERNS), re.IGNORECASE)
+    TECH_COMMITTEE_RE = re.compile('|'.join(TECH_COMMITTEE_PATTERNS), re.IGNORECASE)
+    # Plain substring checks on the title ("chief data", "cdo", "caio")
+    DATA_OFFICER_RE = re.compile('chief data|cdo|caio', re.IGNORECASE)
 
     def analyze_board(self, members: List[BoardMember], committees: List[str]) -> Decimal:
-        score = Decimal("20")
-        if any(any(re.search(p, c.lower()) for p in self.TECH_COMMITTEE_PATTERNS) for c in committees):
-            score += Decimal("15")
-        if any(any(re.search(p, (m.bio + " " + m.title).lower()) for p in self.TECH_PATTERNS) for m in members):
-            score += Decimal("20")
-        if any("chief data" in m.title.lower() or "cdo" in m.title.lower() or "caio" in m.title.lower() for m in members):
-            score += Decimal("15")
-        if len(members) > 0:
-            ratio = sum(1 for m in members if m.is_independent) / len(members)
-            if ratio > 0.5: score += Decimal("10")
-        return clamp(score, Decimal("20"), Decimal("100"))
+        has_tech_committee = any(self.TECH_COMMITTEE_RE.search(c) for c in committees)
+        # One pass over the members collects every member-level signal
+        has_tech_member = has_data_officer = False
+        independent = 0
+        for m in members:
+            if not has_tech_member and self.TECH_RE.search(m.bio + " " + m.title):
+                has_tech_member = True
+            if not has_data_officer and self.DATA_OFFICER_RE.search(m.title):
+                has_data_officer = True
+            if m.is_independent:
+                independent += 1
+        points = 20 + 15 * has_tech_committee + 20 * has_tech_member + 15 * has_data_officer
+        if members and independent / len(members) > 0.5:
+            points += 10
+        return clamp(Decimal(points), Decimal("20"), Decimal("100"))
 
 # --- ENGINE ---
 
 class ScoringIntegrationService:
+    # Confidence/score constants for evidence derived inside score_company, parsed once
+    BOARD_CONFIDENCE = Decimal("0.95")
+    DEFAULT_BOARD_SCORE = Decimal("20.0")
+    DEFAULT_BOARD_CONFIDENCE = Decimal("0.3")
+    DIGITAL_PRESENCE_CONFIDENCE = Decimal("0.85")
+
     def __init__(self):
         self.rubric_scorer = RubricScorer()
         self.dp_analyzer = DigitalPresenceAnalyzer()
@@ -200,55 +324,47 @@ class ScoringIntegrationService:
         if not any(ev.source == SignalSource.BOARD_COMPOSITION for ev in evidence):
             if board_members or board_committees:
                 board_score = self.board_analyzer.analyze_board(board_members, board_committees)
-                evidence.append(EvidenceScore(SignalSource.BOARD_COMPOSITION, board_score, Decimal("0.95"), 1))
+                evidence.append(EvidenceScore(SignalSource.BOARD_COMPOSITION, board_score, self.BOARD_CONFIDENCE, 1))
             else:
                 # Default nascent if truly no data
-                evidence.append(EvidenceScore(SignalSource.BOARD_COMPOSITION, Decimal("20.0"), Decimal("0.3"), 1))
+                evidence.append(EvidenceScore(SignalSource.BOARD_COMPOSITION, self.DEFAULT_BOARD_SCORE, self.DEFAULT_BOARD_CONFIDENCE, 1))
 
         # 2. Improved Digital Presence (Fixing the 0.0 issue)
-        dp_score = Decimal("0.0") # Initialize dp_score here
+        dp_score = 0.0 # Initialize dp_score here
         for ev in evidence:
             if ev.source == SignalSource.DIGITAL_PRESENCE:
-                dp_score = ev.raw_score
+                dp_score = ev.raw_score_f
                 break
         if dp_score == 0:
-            dp_score = self.dp_analyzer.analyze(job_analysis.raw_job_text)
-            evidence.append(EvidenceScore(SignalSource.DIGITAL_PRESENCE, dp_score, Decimal("0.85"), 1))
+            dp_score = self.dp_analyzer.analyze(job_analysis.raw_job_text, text_lower=job_analysis.raw_job_text_lower)
+            evidence.append(EvidenceScore(SignalSource.DIGITAL_PRESENCE, dp_score, self.DIGITAL_PRESENCE_CONFIDENCE, 1))
 
-        sums = {d: Decimal(0) for d in Dimension}
-        weights = {d: Decimal(0) for d in Dimension}
-        for ev in evidence:
-            m = SIGNAL_MAP.get(ev.source)
-            if not m: continue
-            w = m.primary_weight * ev.confidence * m.reliability
-            sums[m.primary_dimension] += ev.raw_score * w
-            weights[m.primary_dimension] += w
-            for sd, sw in m.secondary_mappings.items():
-                w = sw * ev.confidence * m.reliability
-                sums[sd] += ev.raw_score * w
-                weights[sd] += w
+        # Evidence becomes parallel arrays so the whole sums/weights pass is one compiled kernel
+        batch = EvidenceBatch.from_scores(evidence)
+        sums, weights = _aggregate(batch.source_idx, batch.raw_score, batch.confidence, SIGNAL_WEIGHT_MATRIX)
         
-        dim_scores = {d: (sums[d]/weights[d] if weights[d] > 0 else Decimal("50.0")).quantize(Decimal("0.01")) for d in Dimension}
-
-        leader_ratio = Decimal(job_analysis.senior_ai_jobs) / Decimal(max(1, job_analysis.total_ai_jobs))
-        ts_factor = min(Decimal("1.0"), Decimal("1.0") / Decimal(str(math.sqrt(job_analysis.total_ai_jobs) + 0.1)))
-        skill_conc = max(Decimal("0"), Decimal("1.0") - (Decimal(len(job_analysis.unique_skills)) / Decimal("15.0")))
-        indiv_factor = min(Decimal("1.0"), Decimal(glassdoor_stats.get('mentions', 0)) / Decimal(max(1, glassdoor_stats.get('reviews', 1))))
-        tc = Decimal("0.4")*leader_ratio + Decimal("0.3")*ts_factor + Decimal("0.2")*skill_conc + Decimal("0.1")*indiv_factor
+        # Dimensions without evidence default to 50; scores stay an array (Dimension order) until the return
+        has_weight = weights > 0
+        dim_scores = np.round(np.where(has_weight, sums / np.where(has_weight, weights, 1.0), 50.0), 2)
+
+        leader_ratio = job_analysis.senior_ai_jobs / max(1, job_analysis.total_ai_jobs)
+        ts_factor = min(1.0, 1.0 / (math.sqrt(job_analysis.total_ai_jobs) + 0.1))
+        skill_conc = max(0.0, 1.0 - len(job_analysis.unique_skills) / 15.0)
+        indiv_factor = min(1.0, glassdoor_stats.get('mentions', 0) / max(1, glassdoor_stats.get('reviews', 1)))
+        tc = 0.4*leader_ratio + 0.3*ts_factor + 0.2*skill_conc + 0.1*indiv_factor
         
-        weights_vr = {Dimension.DATA_INFRASTRUCTURE: Decimal("0.15"), Dimension.AI_GOVERNANCE: Decimal("0.10"), Dimension.TECHNOLOGY_STACK: Decimal("0.20"), Dimension.TALENT: Decimal("0.20"), Dimension.LEADERSHIP: Decimal("0.10"), Dimension.USE_CASE_PORTFOLIO: Decimal("0.15"), Dimension.CULTURE: Decimal("0.10")}
-        if sector == "financial_services": weights_vr.update({Dimension.AI_GOVERNANCE: Decimal("0.15"), Dimension.CULTURE: Decimal("0.05")})
+        weights_vr = WEIGHTS_VR_FINANCIAL if sector == "financial_services" else WEIGHTS_VR_DEFAULT
         
-        vr_score = clamp(sum(dim_scores[d] * weights_vr[d] for d in Dimension))
-        pf = Decimal(str(round(0.6 * ((float(vr_score) - 50.0)/50.0) + 0.4 * ((market_cap_p - 0.5)*2), 2)))
-        hr_score = clamp(Decimal("70.0") * (Decimal("1.0") - Decimal("0.15") * max(Decimal("0"), tc - Decimal("0.25"))) * (Decimal("1") + Decimal("0.15") * pf))
-        synergy = (vr_score * hr_score) / Decimal("100")
-        final = Decimal("0.6") * vr_score + Decimal("0.28") * hr_score + Decimal("0.12") * synergy
+        vr_score = float(np.clip(np.dot(dim_scores, weights_vr), 0.0, 100.0))
+        pf = round(0.6 * ((vr_score - 50.0)/50.0) + 0.4 * ((market_cap_p - 0.5)*2), 2)
+        hr_score = clamp(70.0 * (1.0 - 0.15 * max(0.0, tc - 0.25)) * (1.0 + 0.15 * pf), 0.0, 100.0)
+        synergy = (vr_score * hr_score) / 100.0
+        final = 0.6 * vr_score + 0.28 * hr_score + 0.12 * synergy
         
         return {
-            "final_score": float(final), "vr_score": float(vr_score), "hr_score": float(hr_score),
-            "synergy_score": float(synergy), "talent_concentration": float(tc), "position_factor": float(pf),
-            "dimension_scores": {d.value: float(s) for d, s in dim_scores.items()}
+            "final_score": final, "vr_score": vr_score, "hr_score": hr_score,
+            "synergy_score": synergy, "talent_concentration": tc, "position_factor": pf,
+            "dimension_scores": {d.value: float(s) for d, s in zip(Dimension, dim_scores)}
         }
 
 SIGNAL_MAP = {
@@ -262,3 +378,24 @@ SIGNAL_MAP = {
     SignalSource.GLASSDOOR_REVIEWS: DimensionMapping(SignalSource.GLASSDOOR_REVIEWS, Dimension.CULTURE, Decimal("0.80"), {Dimension.TALENT: Decimal("0.10"), Dimension.LEADERSHIP: Decimal("0.10")}, Decimal("0.60")),
     SignalSource.BOARD_COMPOSITION: DimensionMapping(SignalSource.BOARD_COMPOSITION, Dimension.AI_GOVERNANCE, Decimal("0.70"), {Dimension.LEADERSHIP: Decimal("0.30")}, Decimal("0.90"))
 }
+
+def _build_signal_weight_matrix() -> np.ndarray:
+    # [source, dimension] -> mapping weight * source reliability (0 where a source doesn't feed a dimension)
+    W = np.zeros((len(SignalSource), len(Dimension)))
+    for src, m in SIGNAL_MAP.items():
+        W[SOURCE_INDEX[src], DIMENSION_INDEX[m.primary_dimension]] = m.primary_weight_f * m.reliability_f
+        for d, w in m.secondary_mappings_f.items():
+            W[SOURCE_INDEX[src], DIMENSION_INDEX[d]] = w * m.reliability_f
+    return W
+
+SIGNAL_WEIGHT_MATRIX = _build_signal_weight_matrix()
+
+def _dimension_vector(values: Dict[Dimension, float]) -> np.ndarray:
+    vec = np.array([values[d] for d in Dimension])
+    vec.flags.writeable = False
+    return vec
+
+# V^R dimension weights in Dimension order; financial services weights governance up and culture down
+_WEIGHTS_VR = {Dimension.DATA_INFRASTRUCTURE: 0.15, Dimension.AI_GOVERNANCE: 0.10, Dimension.TECHNOLOGY_STACK: 0.20, Dimension.TALENT: 0.20, Dimension.LEADERSHIP: 0.10, Dimension.USE_CASE_PORTFOLIO: 0.15, Dimension.CULTURE: 0.10}
+WEIGHTS_VR_DEFAULT = _dimension_vector(_WEIGHTS_VR)
+WEIGHTS_VR_FINANCIAL = _dimension_vector({**_WEIGHTS_VR, Dimension.AI_GOVERNANCE: 0.15, Dimension.CULTURE: 0.05})
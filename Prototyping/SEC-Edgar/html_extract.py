@@ -2,11 +2,13 @@
 from __future__ import annotations
 
 import re
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from pathlib import Path
 from io import StringIO
 
+import openpyxl
 import pandas as pd
-from bs4 import BeautifulSoup
+from lxml import etree
 
 HTML_PATH = Path("/Users/aakashbelide/Downloads/sec-edgar-filings/0000320193/10-K/0000320193-23-000106/full-submission.html")
 OUT_DIR = Path("/Users/aakashbelide/Downloads/sec-edgar-filings/0000320193/10-K/0000320193-23-000106/html_tables_out")
@@ -20,6 +22,18 @@ def sanitize_sheet_name(name: str) -> str:
     return (name[:31] if len(name) > 31 else name) or "Sheet"
 
 
+def parse_table(i: int, table_html: str) -> list[pd.DataFrame] | None:
+    # Convert this single table into DataFrames (sometimes read_html returns multiple)
+    try:
+        return pd.read_html(StringIO(table_html), flavor="lxml")
+    except ValueError:
+        # Not a parsable table
+        return None
+    except Exception as e:
+        print(f"[WARN] Table {i:03d} parse failed: {e}")
+        return None
+
+
 def main() -> None:
     # --- basic sanity checks ---
     if not HTML_PATH.exists():
@@ -29,46 +43,52 @@ def main() -> None:
     CSV_DIR.mkdir(parents=True, exist_ok=True)
     RAW_DIR.mkdir(parents=True, exist_ok=True)
 
-    html_text = HTML_PATH.read_text(encoding="utf-8", errors="ignore")
-    print(f"[INFO] Loaded HTML bytes: {len(html_text):,}")
-    print(f"[INFO] '<table' occurrences: {html_text.lower().count('<table')}")
+    # Stream the filing instead of loading it whole: iterparse hands over each <table>
+    # as soon as it closes, and finished tables are freed before the next one is read
+    print(f"[INFO] HTML file bytes: {HTML_PATH.stat().st_size:,}")
 
-    # Parse HTML and extract each table tag
-    soup = BeautifulSoup(html_text, "lxml")
-    table_tags = soup.find_all("table")
-    print(f"[INFO] BeautifulSoup found tables: {len(table_tags)}")
-
-    if not table_tags:
-        print("[WARN] No <table> tags found. This file may not contain the primary filing HTML.")
-        return
+    table_indices: list[int] = []
+    table_htmls: list[str] = []
+    table_count = 0
 
-    extracted_dfs: list[pd.DataFrame] = []
-    extracted_raw: list[str] = []
+    for _, table in etree.iterparse(str(HTML_PATH), events=("end",), tag="table", html=True):
+        i = table_count
+        table_count += 1
 
-    for i, table in enumerate(table_tags):
-        table_html = str(table)
+        # Serialize once; the same text is saved and handed to read_html
+        table_html = etree.tostring(table, encoding="unicode", with_tail=False)
 
-        # Save raw table HTML no matter what (useful for debugging)
+        # Save raw table HTML no matter what (useful for debugging). Tables come out in
+        # closing-tag order, so nested ones precede their parent
         raw_path = RAW_DIR / f"table_{i:03d}.html"
         raw_path.write_text(table_html, encoding="utf-8")
-        extracted_raw.append(table_html)
 
-        # Convert this single table into DataFrames (sometimes read_html returns multiple)
-        try:
-            dfs = pd.read_html(StringIO(table_html), flavor="lxml")
-        except ValueError:
-            # Not a parsable table
-            continue
-        except Exception as e:
-            print(f"[WARN] Table {i:03d} parse failed: {e}")
+        # Nested tables are converted along with their top-level parent below
+        if next(table.iterancestors("table"), None) is not None:
             continue
 
-        # Keep non-empty tables
-        for df in dfs:
-            # Skip tiny/empty tables
-            if df is None or df.empty:
-                continue
-            extracted_dfs.append(df)
+        table_indices.append(i)
+        table_htmls.append(table_html)
+        table.clear()
+        while table.getprevious() is not None:
+            del table.getparent()[0]
+
+    print(f"[INFO] lxml found tables: {table_count}")
+
+    if not table_count:
+        print("[WARN] No <table> tags found. This file may not contain the primary filing HTML.")
+        return
+
+    # Tables convert independently and read_html is CPU-bound, so spread them over all cores
+    extracted_dfs: list[pd.DataFrame] = []
+    with ProcessPoolExecutor() as ex:
+        for dfs in ex.map(parse_table, table_indices, table_htmls, chunksize=8):
+            # Keep non-empty tables
+            for df in dfs or []:
+                # Skip tiny/empty tables
+                if df is None or df.empty:
+                    continue
+                extracted_dfs.append(df)
 
     print(f"[INFO] Extracted DataFrames: {len(extracted_dfs)}")
 
@@ -76,17 +96,20 @@ def main() -> None:
         print("[WARN] Found <table> tags but none produced DataFrames. Likely malformed/complex layout tables.")
         return
 
-    # Save CSVs
-    for j, df in enumerate(extracted_dfs):
-        csv_path = CSV_DIR / f"table_{j:03d}.csv"
-        df.to_csv(csv_path, index=False)
+    # Save CSVs (one file per table, written concurrently)
+    with ThreadPoolExecutor(max_workers=8) as ex:
+        list(ex.map(lambda jd: jd[1].to_csv(CSV_DIR / f"table_{jd[0]:03d}.csv", index=False), enumerate(extracted_dfs)))
     print(f"[INFO] Saved CSV tables to: {CSV_DIR}")
 
-    # Save Excel workbook
-    with pd.ExcelWriter(XLSX_PATH, engine="openpyxl") as writer:
-        for j, df in enumerate(extracted_dfs):
-            sheet = sanitize_sheet_name(f"table_{j:03d}")
-            df.to_excel(writer, sheet_name=sheet, index=False)
+    # Save Excel workbook. Write-only mode streams rows to disk instead of holding every cell in memory
+    wb = openpyxl.Workbook(write_only=True)
+    for j, df in enumerate(extracted_dfs):
+        ws = wb.create_sheet(sanitize_sheet_name(f"table_{j:03d}"))
+        ws.append(list(df.columns))
+        # Missing cells stay blank, as with to_excel
+        for row in df.astype(object).where(df.notna(), None).itertuples(index=False, name=None):
+            ws.append(row)
+    wb.save(XLSX_PATH)
     print(f"[INFO] Saved Excel workbook: {XLSX_PATH}")
 
 
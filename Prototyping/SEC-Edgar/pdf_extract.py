@@ -1,9 +1,11 @@
 # extract_tables_from_pdf_tabula.py
 from __future__ import annotations
 
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import List
 
+import openpyxl
 import pandas as pd
 
 PDF_PATH = Path("/Users/aakashbelide/Downloads/sec-edgar-filings/0000320193/10-K/0000320193-23-000106/full-submission.pdf")
@@ -34,12 +36,19 @@ def main() -> None:
     dfs = extract_with_tabula(PDF_PATH)
     print(f"Tabula extracted {len(dfs)} tables")
 
-    for i, df in enumerate(dfs):
-        df.to_csv(CSV_DIR / f"table_{i:03d}.csv", index=False)
+    # One CSV per table, written concurrently
+    with ThreadPoolExecutor(max_workers=8) as ex:
+        list(ex.map(lambda idf: idf[1].to_csv(CSV_DIR / f"table_{idf[0]:03d}.csv", index=False), enumerate(dfs)))
 
-    with pd.ExcelWriter(XLSX_PATH, engine="openpyxl") as writer:
-        for i, df in enumerate(dfs):
-            df.to_excel(writer, sheet_name=f"table_{i:03d}", index=False)
+    # Write-only mode streams rows to disk instead of building every sheet in memory
+    wb = openpyxl.Workbook(write_only=True)
+    for i, df in enumerate(dfs):
+        ws = wb.create_sheet(f"table_{i:03d}")
+        ws.append(list(df.columns))
+        # Missing cells stay blank, as with to_excel
+        for row in df.astype(object).where(df.notna(), None).itertuples(index=False, name=None):
+            ws.append(row)
+    wb.save(XLSX_PATH)
 
     print(f"Saved to {OUT_DIR}")
 
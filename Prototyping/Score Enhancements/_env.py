@@ -0,0 +1,8 @@
+import functools
+from dotenv import load_dotenv
+
+@functools.lru_cache(maxsize=None)
+def ensure_env(override: bool = False):
+    # Parse the platform .env once per process; every script in this folder shares it.
+    # Only run_fix_pipeline lets the file win over variables already set in the shell
+    load_dotenv('../pe-org-air-platform/.env', override=override)
@@ -0,0 +1,25 @@
+
+import atexit
+import functools
+import os
+import snowflake.connector
+
+@functools.lru_cache(maxsize=1)
+def get_connection():
+    # One connection per process: scripts chained together (or run from the same
+    # interpreter) share a single TLS handshake + login instead of reconnecting each time
+    conn = snowflake.connector.connect(
+        user=os.getenv('SNOWFLAKE_USER'),
+        password=os.getenv('SNOWFLAKE_PASSWORD'),
+        account=os.getenv('SNOWFLAKE_ACCOUNT'),
+        warehouse=os.getenv('SNOWFLAKE_WAREHOUSE'),
+        database=os.getenv('SNOWFLAKE_DATABASE'),
+        schema=os.getenv('SNOWFLAKE_SCHEMA'),
+        role=os.getenv('SNOWFLAKE_ROLE'),
+        autocommit=True,
+        client_session_keep_alive=True,
+        # Large results (e.g. SEC chunk text) download their chunks in parallel
+        client_prefetch_threads=8
+    )
+    atexit.register(conn.close)
+    return conn
@@ -0,0 +1,58 @@
+import numpy as np
+
+SECTOR_WEIGHTS = {
+    "default": {
+        "data_infrastructure": 0.15,
+        "ai_governance": 0.10,
+        "technology_stack": 0.20,
+        "talent": 0.20,
+        "leadership": 0.10,
+        "use_case_portfolio": 0.15,
+        "culture": 0.10,
+    },
+    "technology": {
+        "data_infrastructure": 0.15,
+        "ai_governance": 0.10,
+        "technology_stack": 0.25,
+        "talent": 0.20,
+        "leadership": 0.05,
+        "use_case_portfolio": 0.15,
+        "culture": 0.10,
+    },
+    "financial_services": {
+        "data_infrastructure": 0.15,
+        "ai_governance": 0.15,
+        "technology_stack": 0.20,
+        "talent": 0.20,
+        "leadership": 0.10,
+        "use_case_portfolio": 0.15,
+        "culture": 0.05,
+    }
+}
+
+# Weights as float arrays in a fixed dimension order, so VR is a single dot product
+_DIMS = tuple(SECTOR_WEIGHTS["default"])
+_WEIGHTS_NP = {
+    sector: np.array([weights[d] for d in _DIMS])
+    for sector, weights in SECTOR_WEIGHTS.items()
+}
+_DEFAULT_WEIGHTS = _WEIGHTS_NP["default"]
+
+def calculate_vr(dimension_scores, sector="default"):
+    # Callers pass the lowercase sector constants, so the exact lookup nearly always hits
+    # and sector.lower() is only paid for mixed-case input
+    weights = _WEIGHTS_NP.get(sector)
+    if weights is None:
+        weights = _WEIGHTS_NP.get(sector.lower(), _DEFAULT_WEIGHTS)
+    scores = np.fromiter((float(dimension_scores.get(d, 50.0)) for d in _DIMS), dtype=np.float64, count=len(_DIMS))
+
+    # Base VR
+    vr_base = scores @ weights
+
+    # CV Penalty
+    mean_score = scores.mean()
+    cv = scores.std() / mean_score if mean_score > 0 else 1.0
+
+    cv_penalty = 1.0 - (0.25 * cv)
+    vr_final = vr_base * cv_penalty
+    return round(float(vr_final), 2)
@@ -1,74 +1,85 @@
 
-import os
 import json
 import asyncio
+from collections import defaultdict
 from datetime import datetime
 from decimal import Decimal
-import snowflake.connector
 from snowflake.connector import DictCursor
-from dotenv import load_dotenv
+from _env import ensure_env
+from _sf import get_connection
 
 # Load environment variables from the platform folder
-load_dotenv('../pe-org-air-platform/.env')
-
-def get_connection():
-    return snowflake.connector.connect(
-        user=os.getenv('SNOWFLAKE_USER'),
-        password=os.getenv('SNOWFLAKE_PASSWORD'),
-        account=os.getenv('SNOWFLAKE_ACCOUNT'),
-        warehouse=os.getenv('SNOWFLAKE_WAREHOUSE'),
-        database=os.getenv('SNOWFLAKE_DATABASE'),
-        schema=os.getenv('SNOWFLAKE_SCHEMA'),
-        role=os.getenv('SNOWFLAKE_ROLE'),
-        autocommit=True
-    )
+ensure_env()
 
 def fetch_data():
     conn = get_connection()
     tickers = ['NVDA', 'JPM', 'WMT', 'GE', 'DG']
     results = {}
     
-    try:
-        with conn.cursor(DictCursor) as cursor:
-            # 1. Get companies
-            cursor.execute("SELECT id, ticker, name, industry_id, position_factor, cik FROM companies WHERE ticker IN (%s, %s, %s, %s, %s)", tuple(tickers))
-            companies = cursor.fetchall()
+    with conn.cursor(DictCursor) as cursor:
+        # 1. Get companies
+        cursor.execute("SELECT id, ticker, name, industry_id, position_factor, cik FROM companies WHERE ticker IN (%s, %s, %s, %s, %s)", tuple(tickers))
+        companies = cursor.fetchall()
+        if not companies:
+            return results
+
+        # Every remaining query covers all companies at once and is bucketed by id below,
+        # so the round-trips no longer grow with the number of tickers
+        cids = [c['ID'] for c in companies]
+        cid_placeholders = ', '.join(['%s'] * len(cids))
+
+        latest_assessments = f"""
+            SELECT * FROM assessments 
+            WHERE company_id IN ({cid_placeholders}) AND assessment_type = 'INTEGRATED_CS3'
+            QUALIFY ROW_NUMBER() OVER (PARTITION BY company_id ORDER BY assessment_date DESC, created_at DESC) = 1
+        """
+        queries = {
+            # 2. Get latest assessment per company
+            "assessments": (latest_assessments, cids),
+            # 3. Get latest signal summaries
+            "summaries": (f"SELECT * FROM company_signal_summaries WHERE company_id IN ({cid_placeholders})", cids),
+            # 4. Get dimension scores of those assessments
+            "dim_scores": (f"""
+                SELECT ds.assessment_id, ds.dimension, ds.score, ds.weight
+                FROM dimension_scores ds
+                JOIN ({latest_assessments}) a ON ds.assessment_id = a.id
+            """, cids),
+            # 5. Get signals count by category
+            "signals": (f"SELECT company_id, category, COUNT(*) as cnt FROM external_signals WHERE company_id IN ({cid_placeholders}) GROUP BY company_id, category", cids),
+        }
+        # The four queries are independent, so submit them all before waiting on any:
+        # they execute concurrently in the warehouse over this one connection
+        query_ids = {}
+        for name, (sql, params) in queries.items():
+            cursor.execute_async(sql, params)
+            query_ids[name] = cursor.sfqid
+        rows = {}
+        for name, query_id in query_ids.items():
+            cursor.get_results_from_sfqid(query_id)
+            rows[name] = cursor.fetchall()
+
+        assessments = {a['COMPANY_ID']: a for a in rows["assessments"]}
+        summaries = {}
+        for summary in rows["summaries"]:
+            summaries.setdefault(summary['COMPANY_ID'], summary)
+        dim_scores = defaultdict(list)
+        for d in rows["dim_scores"]:
+            dim_scores[d.pop('ASSESSMENT_ID')].append(d)
+        signals = defaultdict(list)
+        for s in rows["signals"]:
+            signals[s.pop('COMPANY_ID')].append(s)
             
-            for company in companies:
-                ticker = company['TICKER']
-                cid = company['ID']
-                
-                # 2. Get latest assessment
-                cursor.execute("""
-                    SELECT * FROM assessments 
-                    WHERE company_id = %s AND assessment_type = 'INTEGRATED_CS3'
-                    ORDER BY assessment_date DESC, created_at DESC LIMIT 1
-                """, (cid,))
-                assessment = cursor.fetchone()
-                
-                # 3. Get latest signal summary
-                cursor.execute("SELECT * FROM company_signal_summaries WHERE company_id = %s", (cid,))
-                summary = cursor.fetchone()
-                
-                # 4. Get dimension scores
-                dim_scores = []
-                if assessment:
-                    cursor.execute("SELECT dimension, score, weight FROM dimension_scores WHERE assessment_id = %s", (assessment['ID'],))
-                    dim_scores = cursor.fetchall()
-                
-                # 5. Get signals count by category
-                cursor.execute("SELECT category, COUNT(*) as cnt FROM external_signals WHERE company_id = %s GROUP BY category", (cid,))
-                signals = cursor.fetchall()
-                
-                results[ticker] = {
-                    "company": dict(company),
-                    "assessment": dict(assessment) if assessment else None,
-                    "summary": dict(summary) if summary else None,
-                    "dimension_scores": [dict(d) for d in dim_scores],
-                    "signals": [dict(s) for s in signals]
-                }
-    finally:
-        conn.close()
+        for company in companies:
+            cid = company['ID']
+            assessment = assessments.get(cid)
+            summary = summaries.get(cid)
+            results[company['TICKER']] = {
+                "company": dict(company),
+                "assessment": dict(assessment) if assessment else None,
+                "summary": dict(summary) if summary else None,
+                "dimension_scores": [dict(d) for d in dim_scores[assessment['ID']]] if assessment else [],
+                "signals": [dict(s) for s in signals[cid]]
+            }
     
     return results
 
@@ -1,57 +1,68 @@
 
-import os
-import snowflake.connector
 from snowflake.connector import DictCursor
-from dotenv import load_dotenv
+from _env import ensure_env
+from _sf import get_connection
 
 # Load environment variables from the platform folder
-load_dotenv('../pe-org-air-platform/.env')
+ensure_env()
 
-def get_connection():
-    return snowflake.connector.connect(
-        user=os.getenv('SNOWFLAKE_USER'),
-        password=os.getenv('SNOWFLAKE_PASSWORD'),
-        account=os.getenv('SNOWFLAKE_ACCOUNT'),
-        warehouse=os.getenv('SNOWFLAKE_WAREHOUSE'),
-        database=os.getenv('SNOWFLAKE_DATABASE'),
-        schema=os.getenv('SNOWFLAKE_SCHEMA'),
-        role=os.getenv('SNOWFLAKE_ROLE'),
-        autocommit=True
-    )
+# Duplicate signals are deleted in batches of this many rows, so each DELETE only
+# rewrites the micro-partitions holding that batch and warehouse memory stays bounded
+DELETE_BATCH_SIZE = 50000
 
 def deduplicate():
     conn = get_connection()
-    try:
-        with conn.cursor() as cursor:
-            print("Cleaning up duplicated external_signals...")
-            # Keep the latest signal for each company/category/source/signal_hash
-            # If signal_hash is null, we can't reliably dedup without logic, but let's try MIN(id)
+    with conn.cursor() as cursor:
+        # Each delete joins against the rows to drop (DELETE ... USING) instead of
+        # filtering with NOT IN over a subquery, so Snowflake plans it as one hash join
+        print("Cleaning up duplicated external_signals...")
+        # Keep the first signal (MIN(id)) for each company/category/source/signal_hash;
+        # PARTITION BY groups NULL hashes together, like GROUP BY did.
+        # Batches run outside the transaction below and autocommit one by one, so each
+        # holds its own micro-partition rewrite; a rerun picks up any duplicates left over
+        deleted = 0
+        while True:
             cursor.execute("""
                 DELETE FROM external_signals 
-                WHERE id NOT IN (
-                    SELECT MIN(id) 
+                USING (
+                    SELECT id
                     FROM external_signals 
-                    GROUP BY company_id, category, source, signal_hash
-                )
-            """)
-            print(f"Deleted {cursor.rowcount} duplicate signals.")
+                    QUALIFY ROW_NUMBER() OVER (PARTITION BY company_id, category, source, signal_hash ORDER BY id) > 1
+                    LIMIT %s
+                ) dup
+                WHERE external_signals.id = dup.id
+            """, (DELETE_BATCH_SIZE,))
+            if not cursor.rowcount:
+                break
+            deleted += cursor.rowcount
+        print(f"Deleted {deleted} duplicate signals.")
 
+        # The remaining deletes share one transaction, so they are all-or-nothing
+        cursor.execute("BEGIN")
+        try:
             print("Cleaning up signal_evidence...")
             # Keep only evidence linked to existing signals
             cursor.execute("""
                 DELETE FROM signal_evidence 
-                WHERE signal_id NOT IN (SELECT id FROM external_signals)
+                USING (
+                    SELECT se.id
+                    FROM signal_evidence se
+                    LEFT JOIN external_signals es ON se.signal_id = es.id
+                    WHERE es.id IS NULL AND se.signal_id IS NOT NULL
+                ) orphan
+                WHERE signal_evidence.id = orphan.id
             """)
             print(f"Deleted {cursor.rowcount} orphaned evidence items.")
 
             # Optional: Deduplicate evidence itself if titles are identical for same ID
             cursor.execute("""
                 DELETE FROM signal_evidence
-                WHERE id NOT IN (
-                    SELECT MIN(id)
+                USING (
+                    SELECT id
                     FROM signal_evidence
-                    GROUP BY signal_id, title, description
-                )
+                    QUALIFY ROW_NUMBER() OVER (PARTITION BY signal_id, title, description ORDER BY id) > 1
+                ) dup
+                WHERE signal_evidence.id = dup.id
             """)
             print(f"Deleted {cursor.rowcount} duplicate evidence items.")
 
@@ -59,12 +70,12 @@ def deduplicate():
             # Keep only the latest assessment for each company
             cursor.execute("""
                 DELETE FROM assessments
-                WHERE id NOT IN (
-                    SELECT id FROM (
-                        SELECT id, ROW_NUMBER() OVER (PARTITION BY company_id, assessment_type ORDER BY created_at DESC) as rn
-                        FROM assessments
-                    ) WHERE rn = 1
-                )
+                USING (
+                    SELECT id
+                    FROM assessments
+                    QUALIFY ROW_NUMBER() OVER (PARTITION BY company_id, assessment_type ORDER BY created_at DESC) > 1
+                ) old
+                WHERE assessments.id = old.id
             """)
             print(f"Deleted {cursor.rowcount} old assessments.")
 
@@ -72,12 +83,20 @@ def deduplicate():
             # Remove scores for deleted assessments
             cursor.execute("""
                 DELETE FROM dimension_scores
-                WHERE assessment_id NOT IN (SELECT id FROM assessments)
+                USING (
+                    SELECT ds.id
+                    FROM dimension_scores ds
+                    LEFT JOIN assessments a ON ds.assessment_id = a.id
+                    WHERE a.id IS NULL AND ds.assessment_id IS NOT NULL
+                ) orphan
+                WHERE dimension_scores.id = orphan.id
             """)
             print(f"Deleted {cursor.rowcount} orphaned dimension scores.")
+            conn.commit()
+        except Exception:
+            conn.rollback()
+            raise
 
-    finally:
-        conn.close()
 
 if __name__ == "__main__":
     deduplicate()
@@ -1,78 +1,80 @@
 
-import os
 import json
 import asyncio
 from datetime import datetime
 from decimal import Decimal
-import snowflake.connector
 from snowflake.connector import DictCursor
-from dotenv import load_dotenv
+from _env import ensure_env
+from _sf import get_connection
 
-load_dotenv('../pe-org-air-platform/.env')
-
-def get_connection():
-    return snowflake.connector.connect(
-        user=os.getenv('SNOWFLAKE_USER'),
-        password=os.getenv('SNOWFLAKE_PASSWORD'),
-        account=os.getenv('SNOWFLAKE_ACCOUNT'),
-        warehouse=os.getenv('SNOWFLAKE_WAREHOUSE'),
-        database=os.getenv('SNOWFLAKE_DATABASE'),
-        schema=os.getenv('SNOWFLAKE_SCHEMA'),
-        role=os.getenv('SNOWFLAKE_ROLE'),
-        autocommit=True
-    )
+ensure_env()
 
 def fetch_real_evidence_and_metrics():
     conn = get_connection()
     tickers = ['NVDA', 'JPM', 'WMT', 'GE', 'DG']
     results = {}
     
-    try:
-        with conn.cursor(DictCursor) as cursor:
-            # 1. Get companies
-            cursor.execute("SELECT id, ticker, name, industry_id, position_factor FROM companies WHERE ticker IN (%s, %s, %s, %s, %s)", tuple(tickers))
-            companies = cursor.fetchall()
+    with conn.cursor(DictCursor) as cursor:
+        # 1. Get companies
+        cursor.execute("SELECT id, ticker, name, industry_id, position_factor FROM companies WHERE ticker IN (%s, %s, %s, %s, %s)", tuple(tickers))
+        companies = cursor.fetchall()
             
-            for company in companies:
-                ticker = company['TICKER']
-                cid = company['ID']
-                
-                # 2. Get SEC Chunks (Evidence Text) - Use the exact join logic from the API
-                cursor.execute("""
-                    SELECT dc.chunk_text
-                    FROM document_chunks dc
-                    JOIN documents d ON dc.document_id = d.document_id
-                    JOIN companies c ON (
-                        UPPER(d.cik) = UPPER(c.cik) OR 
-                        UPPER(d.cik) = UPPER(c.ticker) OR 
-                        UPPER(d.company_name) = UPPER(c.name) OR 
-                        UPPER(d.company_name) = UPPER(c.ticker)
-                    )
-                    WHERE c.id = %s
-                    ORDER BY d.created_at DESC, dc.chunk_index ASC
-                    LIMIT 200
-                """, (cid,))
-                chunks = cursor.fetchall()
-                full_text = "\n".join([c['CHUNK_TEXT'] for c in chunks if c['CHUNK_TEXT']])
-                
-                # 3. Get Signal Summary (Real Scores)
-                cursor.execute("SELECT * FROM company_signal_summaries WHERE company_id = %s", (cid,))
-                summary = cursor.fetchone()
-                
-                # 4. Get Signal Counts
-                cursor.execute("SELECT COUNT(*) as cnt FROM external_signals WHERE company_id = %s", (cid,))
-                sig_count = cursor.fetchone()
+        if not companies:
+            return results
+        cids = [c['ID'] for c in companies]
+        cid_placeholders = ', '.join(['%s'] * len(cids))
+
+        # 2. Get SEC Chunks (Evidence Text) - Use the exact join logic from the API.
+        # Each company's latest 200 chunks are concatenated server-side, so one row per
+        # company comes back instead of 200 rows per ticker
+        cursor.execute(f"""
+            WITH ranked AS (
+                SELECT dc.chunk_text, c.id AS cid,
+                       ROW_NUMBER() OVER (PARTITION BY c.id ORDER BY d.created_at DESC, dc.chunk_index ASC) AS rn
+                FROM document_chunks dc
+                JOIN documents d ON dc.document_id = d.document_id
+                JOIN companies c ON (
+                    UPPER(d.cik) = UPPER(c.cik) OR 
+                    UPPER(d.cik) = UPPER(c.ticker) OR 
+                    UPPER(d.company_name) = UPPER(c.name) OR 
+                    UPPER(d.company_name) = UPPER(c.ticker)
+                )
+                WHERE c.id IN ({cid_placeholders})
+            )
+            SELECT cid, LISTAGG(chunk_text, '\n') WITHIN GROUP (ORDER BY rn) AS full_text
+            FROM ranked
+            WHERE rn <= 200 AND chunk_text <> ''
+            GROUP BY cid
+        """, cids)
+        # The concatenated texts are multi-KB strings, so read them as Arrow columns
+        # rather than materializing a dict per row
+        text_table = cursor.fetch_arrow_all(force_return_table=True)
+        texts = dict(zip(text_table.column('CID').to_pylist(), text_table.column('FULL_TEXT').to_pylist()))
+            
+        # 3. Get Signal Summaries (Real Scores)
+        cursor.execute(f"SELECT * FROM company_signal_summaries WHERE company_id IN ({cid_placeholders})", cids)
+        summaries = {}
+        for summary in cursor.fetchall():
+            summaries.setdefault(summary['COMPANY_ID'], summary)
+            
+        # 4. Get Signal Counts
+        cursor.execute(f"SELECT company_id, COUNT(*) as cnt FROM external_signals WHERE company_id IN ({cid_placeholders}) GROUP BY company_id", cids)
+        sig_counts = {row['COMPANY_ID']: row['CNT'] for row in cursor.fetchall()}
+            
+        for company in companies:
+            ticker = company['TICKER']
+            cid = company['ID']
+            full_text = texts.get(cid) or ""
+            summary = summaries.get(cid)
                 
-                results[ticker] = {
-                    "company_id": cid,
-                    "pf_current": float(company['POSITION_FACTOR']),
-                    "sec_text_sample": full_text,
-                    "signals": dict(summary) if summary else {},
-                    "total_signals": sig_count['CNT'] if sig_count else 0
-                }
-                print(f"Fetched real data for {ticker}. Text length: {len(full_text)}")
-    finally:
-        conn.close()
+            results[ticker] = {
+                "company_id": cid,
+                "pf_current": float(company['POSITION_FACTOR']),
+                "sec_text_sample": full_text,
+                "signals": dict(summary) if summary else {},
+                "total_signals": sig_counts.get(cid, 0)
+            }
+            print(f"Fetched real data for {ticker}. Text length: {len(full_text)}")
     
     return results
 
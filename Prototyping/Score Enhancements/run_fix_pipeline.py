@@ -1,10 +1,10 @@
 import os
 import sys
 import asyncio
-from dotenv import load_dotenv
+from _env import ensure_env
 
 # Load environment variables early
-load_dotenv('../pe-org-air-platform/.env', override=True)
+ensure_env(override=True)
 
 # Add platform to path
 sys.path.append(os.path.abspath('../pe-org-air-platform'))
@@ -13,13 +13,13 @@ from app.pipelines.integration_pipeline import IntegrationPipeline
 from app.services.snowflake import db
 
 async def run_fix_batch():
-    load_dotenv('../pe-org-air-platform/.env')
     pipeline = IntegrationPipeline()
     
     tickers = ['NVDA', 'JPM', 'WMT', 'GE', 'DG']
     print(f"Starting integration pipeline for {tickers}...")
     
-    for ticker in tickers:
+    # run_integration is I/O-bound (Snowflake, LLM calls), so the handful of tickers run concurrently
+    async def _safe_run(ticker):
         try:
             print(f"Processing {ticker}...")
             # run_integration handles the whole flow
@@ -28,5 +28,7 @@ async def run_fix_batch():
         except Exception as e:
             print(f"Error processing {ticker}: {e}")
 
+    await asyncio.gather(*(_safe_run(ticker) for ticker in tickers))
+
 if __name__ == "__main__":
     asyncio.run(run_fix_batch())
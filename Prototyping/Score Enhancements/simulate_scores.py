@@ -1,81 +1,30 @@
 
 import json
-from decimal import Decimal
-import math
+from _vr import SECTOR_WEIGHTS, calculate_vr
 
 class Simulation:
     def __init__(self, data_file):
         with open(data_file, 'r') as f:
             self.data = json.load(f)
-        
-        self.sector_weights = {
-            "default": {
-                "data_infrastructure": Decimal("0.15"),
-                "ai_governance": Decimal("0.10"),
-                "technology_stack": Decimal("0.20"),
-                "talent": Decimal("0.20"),
-                "leadership": Decimal("0.10"),
-                "use_case_portfolio": Decimal("0.15"),
-                "culture": Decimal("0.10"),
-            },
-            "technology": {
-                "data_infrastructure": Decimal("0.15"),
-                "ai_governance": Decimal("0.10"),
-                "technology_stack": Decimal("0.25"),
-                "talent": Decimal("0.20"),
-                "leadership": Decimal("0.05"),
-                "use_case_portfolio": Decimal("0.15"),
-                "culture": Decimal("0.10"),
-            },
-            "financial_services": {
-                "data_infrastructure": Decimal("0.15"),
-                "ai_governance": Decimal("0.15"),
-                "technology_stack": Decimal("0.20"),
-                "talent": Decimal("0.20"),
-                "leadership": Decimal("0.10"),
-                "use_case_portfolio": Decimal("0.15"),
-                "culture": Decimal("0.05"),
-            }
-        }
+        self.sector_weights = SECTOR_WEIGHTS
 
     def calculate_vr(self, dimension_scores, sector="default"):
-        weights = self.sector_weights.get(sector.lower(), self.sector_weights["default"])
-        
-        # Base VR
-        vr_base = Decimal("0")
-        scores_list = []
-        for dim, weight in weights.items():
-            score = Decimal(str(dimension_scores.get(dim, 50.0)))
-            vr_base += score * weight
-            scores_list.append(score)
-        
-        # CV Penalty
-        mean_score = sum(scores_list) / len(scores_list)
-        if mean_score > 0:
-            variance = sum((s - mean_score)**2 for s in scores_list) / len(scores_list)
-            std_dev = Decimal(str(math.sqrt(float(variance))))
-            cv = std_dev / mean_score
-        else:
-            cv = Decimal("1.0")
-        
-        cv_penalty = Decimal("1.0") - (Decimal("0.25") * cv)
-        vr_final = vr_base * cv_penalty
-        return vr_final.quantize(Decimal("0.01"))
+        return calculate_vr(dimension_scores, sector)
 
     def calculate_hr(self, hr_base, tc, pf):
         # Talent Risk Adjuster
-        tc_penalty_range = max(Decimal("0"), Decimal(str(tc)) - Decimal("0.25"))
-        hr_modifier = Decimal("1.0") - (Decimal("0.15") * tc_penalty_range)
+        tc_penalty_range = max(0.0, tc - 0.25)
+        hr_modifier = 1.0 - (0.15 * tc_penalty_range)
         
-        hr_adjusted_base = Decimal(str(hr_base)) * hr_modifier
-        hr_final = hr_adjusted_base * (Decimal("1") + Decimal("0.15") * Decimal(str(pf)))
-        return hr_final.quantize(Decimal("0.01"))
+        hr_adjusted_base = hr_base * hr_modifier
+        hr_final = hr_adjusted_base * (1 + 0.15 * pf)
+        return round(hr_final, 2)
 
     def calculate_org_air(self, vr, hr):
-        synergy = (vr * hr) / Decimal("100")
-        base_readiness = (Decimal("0.6") * vr) + (Decimal("0.4") * hr)
-        final_score = (Decimal("0.88") * base_readiness) + (Decimal("0.12") * synergy)
-        return final_score.quantize(Decimal("0.01"))
+        synergy = (vr * hr) / 100
+        base_readiness = (0.6 * vr) + (0.4 * hr)
+        final_score = (0.88 * base_readiness) + (0.12 * synergy)
+        return round(final_score, 2)
 
     def run_simulation(self):
         targets = {
@@ -1,6 +1,7 @@
 
 import json
 from decimal import Decimal
+import numpy as np
 
 class EnhancedPFCalculator:
     def __init__(self):
@@ -42,6 +43,24 @@ class EnhancedPFCalculator:
         final_pf = max(-1.0, min(1.0, pf))
         return round(final_pf, 2)
 
+    def calculate_pf_batch(self, vr_scores, sectors, mcap_percentiles, signal_counts) -> np.ndarray:
+        """calculate_pf for many companies at once, as whole-array operations."""
+        vr_scores = np.asarray(vr_scores, dtype=np.float64)
+        mcap_percentiles = np.asarray(mcap_percentiles, dtype=np.float64)
+        signal_counts = np.asarray(signal_counts, dtype=np.float64)
+        avg_vr = np.array([self.sector_avg_vr.get(s.lower(), 50.0) for s in sectors])
+
+        vr_component = np.clip((vr_scores - avg_vr) / 50.0, -1.0, 1.0)
+        mcap_component = (mcap_percentiles - 0.5) * 2.0
+        intensity = np.where(signal_counts > 2, np.minimum(1.0, (signal_counts - 2) / 10.0), -0.5)
+        leadership_bonus = np.where(
+            (mcap_percentiles > 0.95) & (vr_scores > avg_vr), 0.5,
+            np.where(mcap_percentiles < 0.2, -0.3, 0.0)
+        )
+
+        pf = (0.4 * vr_component) + (0.3 * mcap_component) + (0.3 * intensity) + leadership_bonus
+        return np.round(np.clip(pf, -1.0, 1.0), 2)
+
 def run_test():
     calc = EnhancedPFCalculator()
     # Mock data based on audit results
@@ -55,8 +74,13 @@ def run_test():
 
     print(f"{'Ticker':<8} | {'VR':<5} | {'MCap%':<6} | {'Sig':<3} | {'Enhanced PF':<12}")
     print("-" * 45)
-    for c in companies:
-        pf = calc.calculate_pf(c['vr'], c['sector'], c['mcap_p'], c['signals'])
+    pfs = calc.calculate_pf_batch(
+        [c['vr'] for c in companies],
+        [c['sector'] for c in companies],
+        [c['mcap_p'] for c in companies],
+        [c['signals'] for c in companies],
+    )
+    for c, pf in zip(companies, pfs.tolist()):
         print(f"{c['ticker']:<8} | {c['vr']:<5} | {c['mcap_p']:<6} | {c['signals']:<3} | {pf:<12}")
 
 if __name__ == "__main__":
@@ -1,8 +1,11 @@
 
+import sys
+from collections import defaultdict
 from decimal import Decimal
 from enum import Enum
 from dataclasses import dataclass
 from typing import Dict, List
+import ahocorasick
 
 class ScoreLevel(Enum):
     LEVEL_5 = (80, 100, "Excellent")
@@ -29,14 +32,35 @@ class EnhancedRubricScorer:
                 ScoreLevel.LEVEL_1: RubricCriteria(ScoreLevel.LEVEL_1, ["exploring", "no use cases"], 0),
             }
         }
+        # One automaton per dimension; each keyword maps to the levels that list it,
+        # so a single pass over the text classifies every keyword of every level
+        self._automata = {}
+        for dimension, rubric in self.rubrics.items():
+            levels_by_kw = defaultdict(list)
+            for level, criteria in rubric.items():
+                # Interned, so the automaton payloads and criteria share one object per keyword
+                criteria.keywords = [sys.intern(kw) for kw in criteria.keywords]
+                for kw in criteria.keywords:
+                    levels_by_kw[kw].append(level)
+            automaton = ahocorasick.Automaton()
+            for kw, levels in levels_by_kw.items():
+                automaton.add_word(kw, (kw, tuple(levels)))
+            automaton.make_automaton()
+            self._automata[dimension] = automaton
 
-    def score_dimension(self, dimension, text):
-        text = text.lower()
+    def score_dimension(self, dimension, text, text_lower=None):
+        # Callers scoring one text across several dimensions can lower it once and pass it in
+        text = text_lower if text_lower is not None else text.lower()
         rubric = self.rubrics.get(dimension, {})
+        hits = defaultdict(set)
+        if dimension in self._automata:
+            for _, (kw, levels) in self._automata[dimension].iter(text):
+                for level in levels:
+                    hits[level].add(kw)
         
         for level in [ScoreLevel.LEVEL_5, ScoreLevel.LEVEL_4, ScoreLevel.LEVEL_3, ScoreLevel.LEVEL_2, ScoreLevel.LEVEL_1]:
             criteria = rubric[level]
-            matches = [kw for kw in criteria.keywords if kw in text]
+            matches = [kw for kw in criteria.keywords if kw in hits[level]]
             
             if len(matches) >= criteria.min_keyword_matches:
                 density = len(matches) / max(len(criteria.keywords), 1)
@@ -66,10 +90,10 @@ def run_test():
     """
 
     print("NVDA Enhanced Score:")
-    print(json.dumps(scorer.score_dimension("use_case_portfolio", nvda_text), indent=2))
+    print(json.dumps(scorer.score_dimension("use_case_portfolio", nvda_text, nvda_text.lower()), indent=2))
     
     print("\nDG Enhanced Score:")
-    print(json.dumps(scorer.score_dimension("use_case_portfolio", dg_text), indent=2))
+    print(json.dumps(scorer.score_dimension("use_case_portfolio", dg_text, dg_text.lower()), indent=2))
 
 if __name__ == "__main__":
     import json
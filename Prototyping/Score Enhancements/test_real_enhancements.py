@@ -1,13 +1,27 @@
 
+import functools
 import json
-from decimal import Decimal
+import os
 import math
 import re
+import ahocorasick
+import numpy as np
+
+try:
+    import orjson
+except ImportError:
+    # Optional: without orjson the data file is parsed by the stdlib json module
+    orjson = None
+
+def calc_final(vr: float, hr: float) -> float:
+    synergy = (vr * hr) / 100.0
+    base_readiness = (0.6 * vr) + (0.4 * hr)
+    return (0.88 * base_readiness) + (0.12 * synergy)
 
 class EnhancedScorerSimulation:
     def __init__(self, data_file):
-        with open(data_file, 'r') as f:
-            self.data = json.load(f)
+        # The mtime is part of the cache key, so an edited data file is re-read
+        self.data = self._load(data_file, os.path.getmtime(data_file))
         
         self.use_case_keywords = [
             "production ai", "3x roi", "ai product", "h100", "cuda", 
@@ -16,17 +30,30 @@ class EnhancedScorerSimulation:
             "supply chain optimization", "inventory forecasting", "predictive analytics",
             "customer personalization", "algorithmic trading", "fraud detection"
         ]
+        # Short keywords need word boundaries ("cuda" but not "barracuda"), so they share one
+        # compiled alternation; longer phrases are substring matches found by one automaton pass
+        short = sorted((kw for kw in self.use_case_keywords if len(kw) <= 4), key=len, reverse=True)
+        self._short_re = re.compile(r'\b(?:' + '|'.join(map(re.escape, short)) + r')\b') if short else None
+        self._automaton = ahocorasick.Automaton()
+        for kw in self.use_case_keywords:
+            if len(kw) > 4:
+                self._automaton.add_word(kw, kw)
+        self._automaton.make_automaton()
+
+    @classmethod
+    @functools.lru_cache(maxsize=8)
+    def _load(cls, path, mtime):
+        with open(path, 'rb') as f:
+            raw = f.read()
+        return orjson.loads(raw) if orjson is not None else json.loads(raw)
 
     def score_rubric_enhanced(self, text):
         text = text.lower()
-        matches = []
-        for kw in self.use_case_keywords:
-            if len(kw) <= 4:
-                if re.search(r'\b' + re.escape(kw) + r'\b', text):
-                    matches.append(kw)
-            else:
-                if kw in text:
-                    matches.append(kw)
+        found = {kw for _, kw in self._automaton.iter(text)} if len(self._automaton) else set()
+        if self._short_re:
+            found.update(self._short_re.findall(text))
+        # Reported in keyword-list order, as before
+        matches = [kw for kw in self.use_case_keywords if kw in found]
         
         if len(matches) >= 3:
             level_base = 80
@@ -50,10 +77,23 @@ class EnhancedScorerSimulation:
         pf = (0.4 * vr_component) + (0.3 * mcap_component) + (0.3 * intensity) + bonus
         return max(-1.0, min(1.0, round(pf, 2)))
 
+    def calculate_enhanced_pf_batch(self, vr_scores, sector_avgs, mcap_ps, sig_counts) -> np.ndarray:
+        """calculate_enhanced_pf for many companies at once, as whole-array operations."""
+        vr_scores = np.asarray(vr_scores, dtype=np.float64)
+        sector_avgs = np.asarray(sector_avgs, dtype=np.float64)
+        mcap_ps = np.asarray(mcap_ps, dtype=np.float64)
+        sig_counts = np.asarray(sig_counts, dtype=np.float64)
+
+        vr_component = np.clip((vr_scores - sector_avgs) / 50.0, -1.0, 1.0)
+        mcap_component = (mcap_ps - 0.5) * 2.0
+        intensity = np.where(sig_counts > 2, np.minimum(1.0, (sig_counts - 2) / 10.0), -0.5)
+        bonus = np.where((mcap_ps > 0.95) & (vr_scores > sector_avgs), 0.5, 0.0) + np.where(mcap_ps < 0.3, -0.2, 0.0)
+        pf = (0.4 * vr_component) + (0.3 * mcap_component) + (0.3 * intensity) + bonus
+        return np.clip(np.round(pf, 2), -1.0, 1.0)
+
     def calculate_final_score(self, vr, hr):
-        synergy = (vr * hr) / Decimal("100")
-        base_readiness = (Decimal("0.6") * vr) + (Decimal("0.4") * hr)
-        return (Decimal("0.88") * base_readiness) + (Decimal("0.12") * synergy)
+        # float64 is plenty for a two-decimal scorecard
+        return calc_final(float(vr), float(hr))
 
     def run(self):
         sector_avgs = {"technology": 64, "financial": 55, "retail": 48, "manufacturing": 45}
@@ -68,6 +108,9 @@ class EnhancedScorerSimulation:
         print(f"{'Ticker':<6} | {'Portfolio':<10} | {'VR (w/ Floor)':<12} | {'Final PF':<8} | {'Final Score':<12} | {'Status'}")
         print("-" * 95)
 
+        tc_map = {"NVDA": 0.12, "JPM": 0.18, "WMT": 0.20, "GE": 0.25, "DG": 0.30}
+
+        portfolio_scores, vr_scores = [], []
         for ticker, cfg in configs.items():
             raw = self.data[ticker]
             portfolio_score, _ = self.score_rubric_enhanced(raw['sec_text_sample'])
@@ -76,14 +119,22 @@ class EnhancedScorerSimulation:
                 vr_score_calc = 34.2
             else:
                 vr_score_calc = current_composite
-            
-            vr_score = (vr_score_calc * 0.85) + (portfolio_score * 0.15)
-            pf = self.calculate_enhanced_pf(vr_score, sector_avgs[cfg['sector']], cfg['mcap_p'], raw['total_signals'])
-            tc_map = {"NVDA": 0.12, "JPM": 0.18, "WMT": 0.20, "GE": 0.25, "DG": 0.30}
+            portfolio_scores.append(portfolio_score)
+            vr_scores.append((vr_score_calc * 0.85) + (portfolio_score * 0.15))
+
+        # Position factors for every company in one vectorized pass
+        pfs = self.calculate_enhanced_pf_batch(
+            vr_scores,
+            [sector_avgs[cfg['sector']] for cfg in configs.values()],
+            [cfg['mcap_p'] for cfg in configs.values()],
+            [self.data[ticker]['total_signals'] for ticker in configs]
+        ).tolist()
+
+        for (ticker, cfg), portfolio_score, vr_score, pf in zip(configs.items(), portfolio_scores, vr_scores, pfs):
             tc = tc_map[ticker]
             tc_penalty = max(0, tc - 0.25)
             hr = float(cfg['base']) * (1 - 0.15 * tc_penalty) * (1 + 0.15 * pf)
-            final = self.calculate_final_score(Decimal(str(vr_score)), Decimal(str(hr)))
+            final = self.calculate_final_score(vr_score, hr)
             status = "OK" if cfg['range'][0] <= final <= cfg['range'][1] else "FAIL"
             print(f"{ticker:<6} | {portfolio_score:<10.1f} | {float(vr_score):<12.1f} | {pf:<8.2f} | {float(final):<12.2f} | {status}")
 
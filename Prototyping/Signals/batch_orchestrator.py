@@ -1,9 +1,11 @@
 import asyncio
+import csv
 import json
 import os
 import pandas as pd
 from datetime import datetime, timezone
 from pipelines.orchestrator import PipelineOrchestrator
+from checkpoint import JsonlCheckpoint
 
 companies = [
     {"ticker": "CAT", "name": "Caterpillar Inc."},
@@ -18,6 +20,12 @@ companies = [
     {"ticker": "GS",  "name": "Goldman Sachs"}
 ]
 
+# Companies processed at the same time
+MAX_CONCURRENT_COMPANIES = 4
+
+# Per-company progress log (see checkpoint.JsonlCheckpoint)
+SUMMARY_CHECKPOINT = "orchestrator_results.jsonl"
+
 async def run_batch():
     # Initialize orchestrator with BigQuery project
     orc = PipelineOrchestrator(bq_project="gen-lang-client-0720834968")
@@ -25,22 +33,38 @@ async def run_batch():
     all_summaries = []
     
     print(f"Starting stabilized batch run for {len(companies)} companies...")
-    
-    for company in companies:
-        print(f"\n>>> Processing {company['ticker']} ({company['name']})...")
-        try:
+
+    # Companies run concurrently; the semaphore caps how many hit the collectors at once
+    semaphore = asyncio.Semaphore(MAX_CONCURRENT_COMPANIES)
+
+    async def process(company):
+        async with semaphore:
+            print(f"\n>>> Processing {company['ticker']} ({company['name']})...")
             result = await orc.execute(company['name'], company['ticker'])
-            all_summaries.append(result["summary"])
-            
-            # Save progress incrementally
-            df = pd.DataFrame(all_summaries)
-            df.to_csv("orchestrator_results.csv", index=False)
-            
+            summary_log.write(result["summary"])
+            write_summary_row(result["summary"])
             # Small delay to prevent rate limits
             await asyncio.sleep(2)
-            
-        except Exception as e:
-            print(f"!!! Error processing {company['ticker']}: {e}")
+            return result
+
+    # Rows are streamed to the CSV as companies finish; the header comes from the first summary
+    writer = None
+
+    def write_summary_row(summary):
+        nonlocal writer
+        if writer is None:
+            writer = csv.DictWriter(results_csv, fieldnames=list(summary), lineterminator="\n")
+            writer.writeheader()
+        writer.writerow(summary)
+
+    with JsonlCheckpoint(SUMMARY_CHECKPOINT) as summary_log, \
+            open("orchestrator_results.csv", "w", newline="") as results_csv:
+        results = await asyncio.gather(*(process(c) for c in companies), return_exceptions=True)
+    for company, result in zip(companies, results):
+        if isinstance(result, Exception):
+            print(f"!!! Error processing {company['ticker']}: {result}")
+            continue
+        all_summaries.append(result["summary"])
 
     print("\n" + "="*50)
     print("ORCHESTRATOR BATCH RUN COMPLETE")
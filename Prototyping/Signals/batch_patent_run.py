@@ -21,25 +21,31 @@ COMPANIES = [
     "Goldman Sachs"
 ]
 
+# Companies collected at the same time
+MAX_CONCURRENT_COMPANIES = 4
+
 async def main():
     if not os.getenv("PATENTSVIEW_API_KEY"):
         print("Error: PATENTSVIEW_API_KEY environment variable not set.")
         return
 
     collector = PatentSignalCollectorPatentsView()
-    
-    for company in COMPANIES:
-        print(f"\n========================================")
-        print(f"Starting collection for: {company}")
-        print(f"========================================")
-        try:
+    # Every request already waits on the collector's shared 45 req/min limiter, so
+    # companies can overlap freely; the semaphore only bounds how many are in flight
+    semaphore = asyncio.Semaphore(MAX_CONCURRENT_COMPANIES)
+
+    async def collect(company):
+        async with semaphore:
+            print(f"\n========================================")
+            print(f"Starting collection for: {company}")
+            print(f"========================================")
             await collector.run(company_name=company, years=5)
             print(f"-> Successfully completed {company}")
-        except Exception as e:
-            print(f"-> Error collecting for {company}: {e}")
-            
-        # Small buffer
-        await asyncio.sleep(1)
+
+    results = await asyncio.gather(*(collect(c) for c in COMPANIES), return_exceptions=True)
+    for company, result in zip(COMPANIES, results):
+        if isinstance(result, Exception):
+            print(f"-> Error collecting for {company}: {result}")
 
 if __name__ == "__main__":
     asyncio.run(main())
@@ -1,8 +1,8 @@
 import asyncio
-import json
 import logging
 from typing import List, Dict, Any
 from pipelines_v2.orchestrator import MasterPipeline
+from checkpoint import JsonlCheckpoint, to_json
 
 # Setup basic logging for the batch run
 logging.basicConfig(level=logging.INFO, format='%(asctime)s [%(levelname)s] %(message)s')
@@ -22,6 +22,13 @@ TARGET_COMPANIES = [
     {"ticker": "GS",  "name": "Goldman Sachs"}
 ]
 
+# Companies audited at the same time
+MAX_CONCURRENT_AUDITS = 4
+
+# Per-company progress logs (see checkpoint.JsonlCheckpoint)
+SUMMARY_CHECKPOINT = "summary_results_v2.jsonl"
+SIGNALS_CHECKPOINT = "detailed_signals_v2.jsonl"
+
 async def run_batch_audit():
     """
     Processes all target companies through the V2 pipeline.
@@ -35,34 +42,41 @@ async def run_batch_audit():
     all_detailed_signals = []
     
     logger.info(f"Starting batch AI Audit for {len(TARGET_COMPANIES)} companies...")
-    
-    for company in TARGET_COMPANIES:
-        ticker = company["ticker"]
-        name = company["name"]
-        
-        logger.info(f"\n>>> AUDITING: {ticker} | {name}")
-        
-        try:
-            # We use a 30-second timeout per audit to keep the batch moving
-            # although some scrapers might take longer if they hit retries.
-            result = await pipeline.run(name, ticker)
-            
-            all_summary_results.append(result["summary"])
-            all_detailed_signals.extend(result["signals"])
-            
-            # Temporary local save after each company to prevent data loss
-            with open("summary_results_v2.json", "w") as f:
-                json.dump(all_summary_results, f, indent=4, default=str)
-            
-            with open("detailed_signals_v2.json", "w") as f:
-                json.dump(all_detailed_signals, f, indent=4, default=str)
-                
-            # Rate limiting: wait a bit between companies to avoid IP blocks
-            logger.info("Audit successful. Resting for 5 seconds...")
+
+    # Audits are network-bound (scrapes, APIs, BigQuery), so several run at once;
+    # the semaphore bounds how many companies hit upstream services together
+    semaphore = asyncio.Semaphore(MAX_CONCURRENT_AUDITS)
+
+    async def audit_one(company):
+        async with semaphore:
+            logger.info(f"\n>>> AUDITING: {company['ticker']} | {company['name']}")
+            result = await pipeline.run(company["name"], company["ticker"])
+            summary_log.write(result["summary"])
+            signal_log.write(*result["signals"])
+            # Rate limiting: each slot rests a bit before the next company to avoid IP blocks
+            logger.info(f"Audit successful for {company['ticker']}. Resting for 5 seconds...")
             await asyncio.sleep(5)
-            
-        except Exception as e:
-            logger.error(f"Audit failed for {ticker}: {str(e)}")
+            return result
+
+    # One shared HTTP connection pool for the whole batch
+    async with pipeline:
+        with JsonlCheckpoint(SUMMARY_CHECKPOINT) as summary_log, \
+                JsonlCheckpoint(SIGNALS_CHECKPOINT) as signal_log:
+            results = await asyncio.gather(*(audit_one(c) for c in TARGET_COMPANIES), return_exceptions=True)
+
+    for company, result in zip(TARGET_COMPANIES, results):
+        if isinstance(result, Exception):
+            logger.error(f"Audit failed for {company['ticker']}: {str(result)}")
+            continue
+        all_summary_results.append(result["summary"])
+        all_detailed_signals.extend(result["signals"])
+
+    # Written once at the end instead of re-serializing everything after each company
+    with open("summary_results_v2.json", "w", encoding="utf-8") as f:
+        f.write(to_json(all_summary_results, pretty=True))
+    
+    with open("detailed_signals_v2.json", "w", encoding="utf-8") as f:
+        f.write(to_json(all_detailed_signals, pretty=True))
 
     logger.info("\n" + "="*50)
     logger.info("BATCH AUDIT COMPLETE")
@@ -70,6 +84,7 @@ async def run_batch_audit():
     logger.info(f"Summary records generated: {len(all_summary_results)}")
     logger.info(f"Detailed signals generated: {len(all_detailed_signals)}")
     logger.info("Results saved to summary_results_v2.json and detailed_signals_v2.json")
+    logger.info(f"Per-company checkpoints appended to {SUMMARY_CHECKPOINT} and {SIGNALS_CHECKPOINT}")
 
 if __name__ == "__main__":
     asyncio.run(run_batch_audit())
@@ -1,26 +1,32 @@
 import asyncio
-import subprocess
-import time
 import pandas as pd
 import os
 
+from master_pipeline import MasterPipeline
+
 companies = ["CAT", "DE", "UNH", "HCA", "ADP", "PAYX", "WMT", "TGT", "JPM", "GS"]
 
+# Pipelines running at the same time
+MAX_CONCURRENT_PIPELINES = 3
+
 async def run_pipelines():
     print(f"Starting batch run for {len(companies)} companies...")
-    for company in companies:
-        print(f"\n>>> Running pipeline for {company}...")
-        try:
-            # Run the command and wait for it to finish
-            process = subprocess.run(
-                ["uv", "run", "master_pipeline.py", "--company", company, "--days", "7"],
-                check=True
-            )
+
+    # One pipeline for the whole batch: imports and the BigQuery client are set up once
+    # instead of once per `uv run master_pipeline.py` subprocess
+    pipeline = MasterPipeline()
+    semaphore = asyncio.Semaphore(MAX_CONCURRENT_PIPELINES)
+
+    async def run_one(company):
+        async with semaphore:
+            print(f"\n>>> Running pipeline for {company}...")
+            await pipeline.run_all(company, 7)
             print(f"<<< Completed {company}")
-            # Smaller delay since we have many companies and BigQuery is fast
-            time.sleep(5)
-        except Exception as e:
-            print(f"!!! Failed {company}: {e}")
+
+    results = await asyncio.gather(*(run_one(c) for c in companies), return_exceptions=True)
+    for company, result in zip(companies, results):
+        if isinstance(result, Exception):
+            print(f"!!! Failed {company}: {result}")
 
     # After running all, show the results
     print("\n" + "="*50)
@@ -1,9 +1,11 @@
 import asyncio
+import json
 import logging
 import os
 import pandas as pd
 from datetime import datetime
 from pipelines_v2.orchestrator import MasterPipeline
+from checkpoint import JsonlCheckpoint
 
 # Setup concise logging
 logging.basicConfig(
@@ -16,6 +18,13 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Companies processed at the same time
+MAX_CONCURRENT_COMPANIES = 4
+
+# Per-company progress logs (see checkpoint.JsonlCheckpoint)
+SUMMARY_CHECKPOINT = "batch_results_v2_summary.jsonl"
+SIGNALS_CHECKPOINT = "batch_results_v2_signals.jsonl"
+
 async def run_batch():
     # Verify API Key
     if not os.getenv("PATENTSVIEW_API_KEY"):
@@ -45,31 +54,40 @@ async def run_batch():
     print("STARTING V2 PIPELINE BATCH EXECUTION (FULL LIST)")
     print("="*60 + "\n")
     
-    for company in companies:
-        try:
+    # At most MAX_CONCURRENT_COMPANIES pipeline runs in flight
+    semaphore = asyncio.Semaphore(MAX_CONCURRENT_COMPANIES)
+
+    async def process(company):
+        async with semaphore:
             print(f"\n🚀 Processing: {company['name']} ({company['ticker']})...")
-            result = await pipeline.run(company["name"], company["ticker"])
-            
-            summary = result['summary']
-            signals = result['signals']
-            
-            results_summary.append(summary)
-            all_signals.extend(signals)
-            
-            print(f"✅ COMPLETED: {company['name']}")
-            print(f"   Composite Score: {summary['composite_score']}")
-            print("-" * 40)
-            
-            # Incremental save to prevent data loss
-            pd.DataFrame(results_summary).to_csv("batch_results_v2_summary.csv", index=False)
-            
-        except Exception as e:
-            logger.error(f"❌ FAILED: {company['name']} - {str(e)}")
-            import traceback
-            traceback.print_exc()
-            
-        # Buffer between companies to be polite to APIs
-        await asyncio.sleep(2)
+            try:
+                result = await pipeline.run(company["name"], company["ticker"])
+                summary_log.write(result['summary'])
+                signal_log.write(*result['signals'])
+                print(f"✅ COMPLETED: {company['name']}")
+                print(f"   Composite Score: {result['summary']['composite_score']}")
+                print("-" * 40)
+                return result
+            except Exception as e:
+                logger.error(f"❌ FAILED: {company['name']} - {str(e)}")
+                import traceback
+                traceback.print_exc()
+                return None
+            finally:
+                # Buffer between companies to be polite to APIs
+                await asyncio.sleep(2)
+
+    # One shared HTTP connection pool for the whole batch
+    async with pipeline:
+        with JsonlCheckpoint(SUMMARY_CHECKPOINT) as summary_log, \
+                JsonlCheckpoint(SIGNALS_CHECKPOINT) as signal_log:
+            results = await asyncio.gather(*(process(c) for c in companies))
+
+    for result in results:
+        if result is None:
+            continue
+        results_summary.append(result['summary'])
+        all_signals.extend(result['signals'])
 
     # Final Save
     if results_summary:
@@ -79,7 +97,6 @@ async def run_batch():
 
     if all_signals:
         # We need to flatten metadata for CSV if possible, or just save as JSON string
-        import json
         for s in all_signals:
             if isinstance(s.get('metadata'), dict):
                 s['metadata'] = json.dumps(s['metadata'])
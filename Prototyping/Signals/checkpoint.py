@@ -0,0 +1,39 @@
+import json
+
+try:
+    import orjson
+except ImportError:
+    # Optional: without orjson results are serialized by the stdlib json module
+    orjson = None
+
+def to_json(obj, pretty: bool = False) -> str:
+    """Serializes batch results with the same layout whichever library is installed."""
+    if orjson is not None:
+        # Datetimes go through default=str, as they do with json
+        option = orjson.OPT_PASSTHROUGH_DATETIME
+        if pretty:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(obj, default=str, option=option).decode()
+    return json.dumps(obj, indent=2 if pretty else None, separators=(",", ": ") if pretty else (",", ":"),
+                      ensure_ascii=False, default=str)
+
+class JsonlCheckpoint:
+    """Append-only JSONL progress log, so a crashed batch keeps every company it finished."""
+
+    def __init__(self, path: str):
+        self.path = path
+        self._file = None
+
+    def __enter__(self) -> "JsonlCheckpoint":
+        # Line-buffered: each record reaches disk as soon as it is written
+        self._file = open(self.path, "a", buffering=1, encoding="utf-8")
+        return self
+
+    def __exit__(self, *exc):
+        self._file.close()
+        self._file = None
+
+    def write(self, *records):
+        """Appends one line per record; nothing written earlier is rewritten."""
+        for record in records:
+            self._file.write(to_json(record) + "\n")
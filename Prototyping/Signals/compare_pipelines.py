@@ -18,11 +18,13 @@ async def compare_pipelines(company_name: str, ticker: str, categories: List[str
     original = OriginalOrchestrator(bq_project="gen-lang-client-0720834968")
     v2 = V2Orchestrator(bq_project="gen-lang-client-0720834968")
     
-    logger.info(f"Running Original Pipeline (Focused: {categories or 'All'})...")
-    orig_res = await original.execute(company_name, ticker)
-    
-    logger.info(f"Running V2 Pipeline (Focused: {categories or 'All'})...")
-    v2_res = await v2.run(company_name, ticker)
+    # The two pipelines hit different APIs independently, so run them side by side
+    logger.info(f"Running Original and V2 Pipelines concurrently (Focused: {categories or 'All'})...")
+    async with v2:
+        orig_res, v2_res = await asyncio.gather(
+            original.execute(company_name, ticker),
+            v2.run(company_name, ticker)
+        )
     
     # Compare Summary Scores
     print("\n--- SCORE COMPARISON ---")
@@ -47,38 +49,42 @@ async def compare_pipelines(company_name: str, ticker: str, categories: List[str
 
     # Log Evidence Counts
     print("\n--- EVIDENCE COMPARISON ---")
-    def get_signal_meta(res, category):
+    def signal_meta_by_category(res):
+        # One pass per result; the first signal of a category wins, as in a linear search
+        meta = {}
         for s in res["signals"]:
-            if s["category"] == category:
-                return s.get("metadata", {})
-        return {}
+            meta.setdefault(s["category"], s.get("metadata", {}))
+        return meta
+
+    orig_meta = signal_meta_by_category(orig_res)
+    v2_meta = signal_meta_by_category(v2_res)
     
     print(f"{'Evidence Category':<30} | {'Original Count':<15} | {'V2 Count':<15}")
     print("-" * 65)
     
     # Technology Hiring
-    orig_jobs = get_signal_meta(orig_res, "technology_hiring").get("tech_count", 0)
-    v2_jobs = len(get_signal_meta(v2_res, "technology_hiring").get("job_evidence", []))
+    orig_jobs = orig_meta.get("technology_hiring", {}).get("tech_count", 0)
+    v2_jobs = len(v2_meta.get("technology_hiring", {}).get("job_evidence", []))
     print(f"{'Jobs Found':<30} | {orig_jobs:<15} | {v2_jobs:<15}")
 
     # Innovation Activity (Patents)
-    orig_patents = get_signal_meta(orig_res, "innovation_activity").get("ai_count", 0)
-    v2_patents = get_signal_meta(v2_res, "innovation_activity").get("total_ai_patents", 0)
+    orig_patents = orig_meta.get("innovation_activity", {}).get("ai_count", 0)
+    v2_patents = v2_meta.get("innovation_activity", {}).get("total_ai_patents", 0)
     print(f"{'AI Patents Detected':<30} | {orig_patents:<15} | {v2_patents:<15}")
 
     # Digital Presence (Tech Markers)
-    orig_meta_tech = get_signal_meta(orig_res, "digital_presence")
+    orig_meta_tech = orig_meta.get("digital_presence", {})
     orig_tech = orig_meta_tech.get("count", 0)
-    v2_meta_tech = get_signal_meta(v2_res, "digital_presence")
+    v2_meta_tech = v2_meta.get("digital_presence", {})
     v2_tech = v2_meta_tech.get("count", 0)
     print(f"{'Tech Markers':<30} | {orig_tech:<15} | {v2_tech:<15}")
     print(f"  > Original Stack: {orig_meta_tech.get('stack', [])}")
     print(f"  > V2 Stack: {v2_meta_tech.get('technologies_found', [])}")
 
     # Leadership
-    orig_meta_lead = get_signal_meta(orig_res, "leadership_signals")
+    orig_meta_lead = orig_meta.get("leadership_signals", {})
     orig_lead = orig_meta_lead.get("signals_count", 0)
-    v2_meta_lead = get_signal_meta(v2_res, "leadership_signals")
+    v2_meta_lead = v2_meta.get("leadership_signals", {})
     v2_lead = v2_meta_lead.get("signals_count", 0)
     print(f"{'Leadership Indicators':<30} | {orig_lead:<15} | {v2_lead:<15}")
     print(f"  > Original Roles: {[h.get('role') for h in orig_meta_lead.get('leadership_evidence', [])]}")
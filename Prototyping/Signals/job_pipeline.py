@@ -4,6 +4,7 @@ import re
 import logging
 import time
 import random
+import threading
 from dataclasses import dataclass, field
 from typing import List, Set, Optional
 from datetime import datetime
@@ -56,6 +57,10 @@ class JobPipeline:
 
     def __init__(self, output_file="processed_jobs.csv"):
         self.output_file = output_file
+        # process_jobs runs in worker threads when companies are batched in-process;
+        # the history merge below is a read-modify-write of output_file. The lock orders
+        # the writers, and the replace keeps readers (tech stack, leadership) off a half-written file
+        self._save_lock = threading.Lock()
 
     def _is_tech_job(self, title: str) -> bool:
         """Check if posting is a technology job based on title (from screenshot)."""
@@ -196,15 +201,18 @@ class JobPipeline:
 
         if processed_jobs:
             final_df = pd.DataFrame(processed_jobs)
-            if os.path.exists(self.output_file):
-                history = pd.read_csv(self.output_file)
-                final_df = final_df[~final_df['job_url'].isin(history['job_url'])]
-                if not final_df.empty:
-                    final_df = pd.concat([history, final_df], ignore_index=True)
-                else:
-                    final_df = history
-            
-            final_df.to_csv(self.output_file, index=False)
+            with self._save_lock:
+                if os.path.exists(self.output_file):
+                    history = pd.read_csv(self.output_file)
+                    final_df = final_df[~final_df['job_url'].isin(history['job_url'])]
+                    if not final_df.empty:
+                        final_df = pd.concat([history, final_df], ignore_index=True)
+                    else:
+                        final_df = history
+                
+                tmp_file = f"{self.output_file}.tmp"
+                final_df.to_csv(tmp_file, index=False)
+                os.replace(tmp_file, self.output_file)
             logging.info(f"Saved {len(processed_jobs)} relevant jobs to {self.output_file}")
             
         return {
@@ -1,5 +1,6 @@
 import os
 import logging
+import threading
 import pandas as pd
 from datetime import datetime, timezone, timedelta
 from typing import List, Dict, Any, Optional
@@ -23,6 +24,9 @@ class PatentSignalV3:
     def __init__(self, project_id: Optional[str] = None):
         self.client = bigquery.Client(project=project_id)
         self.output_file = "patent_signals_v3.csv"
+        # run() is called from worker threads when companies are batched in-process;
+        # the exists() header check and the append have to happen together
+        self._save_lock = threading.Lock()
         
         # Mapping CPCs to the 5/2/10 scoring categories
         self.INNOVATION_MAP = {
@@ -144,7 +148,8 @@ class PatentSignalV3:
             result = self.score_innovation(company_name, df)
             logging.info(f"Result: {result}")
             
-            pd.DataFrame([result]).to_csv(self.output_file, mode='a', index=False, header=not os.path.exists(self.output_file))
+            with self._save_lock:
+                pd.DataFrame([result]).to_csv(self.output_file, mode='a', index=False, header=not os.path.exists(self.output_file))
             return result
         except Exception as e:
             logging.error(f"BQ Error: {e}")
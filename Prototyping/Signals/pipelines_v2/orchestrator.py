@@ -1,4 +1,5 @@
 import asyncio
+import aiohttp
 import logging
 import uuid
 from typing import Dict, List, Any
@@ -21,6 +22,21 @@ class MasterPipeline:
         self.patent_collector = PatentCollector(project_id=bq_project)
         self.tech_collector = TechStackCollector()
         self.lead_collector = LeadershipCollector()
+        self._session = None
+
+    async def __aenter__(self) -> "MasterPipeline":
+        """Opens one HTTP connection pool shared by every run() until the block exits."""
+        self._session = aiohttp.ClientSession(
+            timeout=self.patent_collector.client.timeout,
+            connector=aiohttp.TCPConnector(limit=50, ttl_dns_cache=300)
+        )
+        self.patent_collector.client.session = self._session
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        self.patent_collector.client.session = None
+        await self._session.close()
+        self._session = None
 
     async def run(self, company_name: str, ticker: str, company_id: str = None) -> Dict[str, Any]:
         """
@@ -107,8 +123,8 @@ class MasterPipeline:
 
 # Example usage entry point
 async def main():
-    pipeline = MasterPipeline(bq_project="gen-lang-client-0720834968")
-    result = await pipeline.run("Caterpillar Inc.", "CAT")
+    async with MasterPipeline(bq_project="gen-lang-client-0720834968") as pipeline:
+        result = await pipeline.run("Caterpillar Inc.", "CAT")
     
     # This structure is now ready to be pushed to Snowflake
     print(f"Summary: {result['summary']}")
@@ -1,4 +1,5 @@
 import asyncio
+import contextlib
 import logging
 import os
 import re
@@ -63,6 +64,9 @@ class PatentsViewClient:
         self.api_key = api_key
         self.limiter = AsyncRateLimiter(requests_per_minute=rpm)
         self.timeout = aiohttp.ClientTimeout(total=timeout_sec)
+        # Set by MasterPipeline for the length of a batch so every company reuses one
+        # connection pool; without it each fetch opens (and closes) its own session
+        self.session: Optional[aiohttp.ClientSession] = None
 
     async def _request_json(
         self,
@@ -163,7 +167,8 @@ class PatentsViewClient:
         after = None
         pages = 0
 
-        async with aiohttp.ClientSession(timeout=self.timeout) as session:
+        session_cm = contextlib.nullcontext(self.session) if self.session else aiohttp.ClientSession(timeout=self.timeout)
+        async with session_cm as session:
             while True:
                 o = {"size": page_size}
                 if after is not None:
@@ -100,12 +100,12 @@ def main():
     if os.path.exists(env_path):
         load_dotenv(env_path)
     
-    # Load JPM reviews
-    csv_path = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'Glassdoor review analysis', 'target_company_reviews_strict.csv'))
+    # Load JPM reviews (only the company_ticker=JPM partition is read)
+    dataset_path = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'Glassdoor review analysis', 'target_company_reviews_strict'))
     
-    print(f"Loading data from {csv_path}...")
+    print(f"Loading data from {dataset_path}...")
     try:
-        df = pd.read_csv(csv_path)
+        df = pd.read_parquet(dataset_path, filters=[('company_ticker', '==', 'JPM')])
         jpm_reviews = df[df['company_ticker'] == 'JPM'].copy()
         
         # Filter for AI/Tech manually first to focus analysis?
@@ -122,7 +122,7 @@ def main():
         analyze_titles(tech_reviews)
         
     except Exception as e:
-        print(f"Error loading CSV: {e}")
+        print(f"Error loading reviews: {e}")
         return
 
     # Load Snowflake Data
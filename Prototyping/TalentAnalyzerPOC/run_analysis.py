@@ -28,16 +28,17 @@ def main():
 
     # 2. Fetch Glassdoor Data (Components 1, 2, 4)
     # Switched to broader dataset per user request to capture NVDA
-    csv_path = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'Glassdoor review analysis', 'target_company_reviews.csv'))
+    # Hive-partitioned by company_ticker, so only the requested company's partition is read
+    dataset_path = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'Glassdoor review analysis', 'target_company_reviews'))
     
     try:
-        print(f"Loading '{csv_path}'...")
-        if not os.path.exists(csv_path):
-             raise FileNotFoundError(f"CSV not found at {csv_path}")
+        print(f"Loading '{dataset_path}'...")
+        if not os.path.exists(dataset_path):
+             raise FileNotFoundError(f"Reviews dataset not found at {dataset_path}")
              
-        df = pd.read_csv(csv_path)
+        df = pd.read_parquet(dataset_path, filters=[('company_ticker', '==', company_ticker)])
         # Using the command line ticker logic
-        # CSV might have "JPM" or "WMT"?
+        # Dataset might have "JPM" or "WMT"?
         target_reviews = df[df['company_ticker'] == company_ticker].copy()
         
         # If no reviews found, try finding by name if ticker isn't exact in CSV
@@ -48,7 +49,7 @@ def main():
         print(f"Found {len(target_reviews)} reviews for {company_ticker}.")
         
     except Exception as e:
-        print(f"ERROR: Could not load CSV data: {e}")
+        print(f"ERROR: Could not load review data: {e}")
         return
 
     # 3. Fetch Snowflake Data (Component 3: Skill Concentration)
@@ -93,6 +93,13 @@ class BoardCompositionAnalyzer:
         r'\binformation\s+technology\b',
     ]
 
+    # Each pattern list compiled once into a single case-insensitive alternation
+    AI_EXPERTISE_RE = re.compile("|".join(AI_EXPERTISE_PATTERNS), re.IGNORECASE)
+    TECH_COMMITTEE_RE = re.compile("|".join(TECH_COMMITTEE_PATTERNS), re.IGNORECASE)
+    DATA_OFFICER_RE = re.compile("|".join(DATA_OFFICER_PATTERNS), re.IGNORECASE)
+    AI_STRATEGY_RE = re.compile("|".join(AI_STRATEGY_PATTERNS), re.IGNORECASE)
+    RISK_TECH_RE = re.compile("|".join(RISK_TECH_PATTERNS), re.IGNORECASE)
+
     SEC_ENDPOINT = "https://api.sec-api.io/directors-and-board-members"
 
     def __init__(self):
@@ -115,11 +122,9 @@ class BoardCompositionAnalyzer:
         relevant_committees = []
         has_tech = False
         for c in committees:
-            for pattern in self.TECH_COMMITTEE_PATTERNS:
-                if re.search(pattern, c, re.IGNORECASE):
-                    has_tech = True
-                    relevant_committees.append(c)
-                    break
+            if self.TECH_COMMITTEE_RE.search(c):
+                has_tech = True
+                relevant_committees.append(c)
 
         if has_tech:
             score += self.SCORE_TECH_COMMITTEE
@@ -127,10 +132,9 @@ class BoardCompositionAnalyzer:
         # Check for AI expertise on board
         ai_experts = []
         for member in members:
-            has_match = any(
-                re.search(pattern, member.bio, re.IGNORECASE) or 
-                re.search(pattern, member.title, re.IGNORECASE)
-                for pattern in self.AI_EXPERTISE_PATTERNS
+            has_match = bool(
+                self.AI_EXPERTISE_RE.search(member.bio) or
+                self.AI_EXPERTISE_RE.search(member.title)
             )
             
             if has_match:
@@ -143,10 +147,9 @@ class BoardCompositionAnalyzer:
         # Check for data officer role
         has_data_officer = False
         for member in members:
-            has_match = any(
-                re.search(pattern, member.title, re.IGNORECASE) or
-                re.search(pattern, member.bio, re.IGNORECASE)
-                for pattern in self.DATA_OFFICER_PATTERNS
+            has_match = bool(
+                self.DATA_OFFICER_RE.search(member.title) or
+                self.DATA_OFFICER_RE.search(member.bio)
             )
             if has_match:
                 has_data_officer = True
@@ -168,13 +171,10 @@ class BoardCompositionAnalyzer:
         # Check risk committee oversight
         has_risk_tech_oversight = False
         for c in committees:
-            if "risk" in c.lower():
-                for pattern in self.RISK_TECH_PATTERNS:
-                    if re.search(pattern, c, re.IGNORECASE):
-                        has_risk_tech_oversight = True
-                        if c not in relevant_committees:
-                            relevant_committees.append(c)
-                        break
+            if "risk" in c.lower() and self.RISK_TECH_RE.search(c):
+                has_risk_tech_oversight = True
+                if c not in relevant_committees:
+                    relevant_committees.append(c)
 
         if has_risk_tech_oversight:
             score += self.SCORE_RISK_OVERSIGHT
@@ -182,10 +182,7 @@ class BoardCompositionAnalyzer:
         # Check AI in strategy
         has_ai_in_strategy = False
         if strategy_text:
-            has_ai_in_strategy = any(
-                re.search(pattern, strategy_text, re.IGNORECASE)
-                for pattern in self.AI_STRATEGY_PATTERNS
-            )
+            has_ai_in_strategy = bool(self.AI_STRATEGY_RE.search(strategy_text))
 
             if has_ai_in_strategy:
                 score += self.SCORE_STRATEGIC_PRIORITY